@@ -10,18 +10,17 @@ CHECK_GROUP_EXISTS = """
     SELECT Name FROM [QTasks3].[dbo].[QCheck_Groups] WHERE Name=%s
 """
 
-FIND_SIMILAR_GROUPS = """
-    SELECT TOP 5 Name 
-    FROM [QTasks3].[dbo].[QCheck_Groups] 
-    WHERE Name LIKE %s 
-    ORDER BY Name
+LIST_ALL_GROUPS = """
+    SELECT Name FROM [QTasks3].[dbo].[QCheck_Groups]
 """
 
 # User queries
 GET_ACTIVE_USERS = """
     -- Only return users who are properly configured for task creation
     -- These users exist in both QCheck_Users and QCheck_Groups tables
-    SELECT DISTINCT u.FullName
+    -- TotalActive (all non-deleted users) is returned alongside for the configuration-rate log
+    SELECT DISTINCT u.FullName,
+        (SELECT COUNT(*) FROM [QTasks3].[dbo].[QCheck_Users] WHERE isdeleted <> 1) AS TotalActive
     FROM [QTasks3].[dbo].[QCheck_Users] u
     INNER JOIN [QTasks3].[dbo].[QCheck_Groups] g ON u.FullName = g.Name
     WHERE u.isdeleted <> 1
@@ -51,12 +50,13 @@ GET_ACTIVE_CHECKLIST_ID = """
     WHERE InstanceID = %s
 """
 
-GET_USERS_IN_GROUP = """
-    SELECT DISTINCT u.ID
+# Format with placeholders=", ".join(["%s"] * len(group_names))
+GET_USERS_IN_GROUPS = """
+    SELECT DISTINCT u.ID, g.Name
     FROM QCheck_Users u
     INNER JOIN QCheck_GroupMembership gm ON u.ID = gm.UserID
     INNER JOIN QCheck_Groups g ON gm.GroupID = g.ID
-    WHERE g.Name = %s AND u.isdeleted = 0
+    WHERE g.Name IN ({placeholders}) AND u.isdeleted = 0
 """
 
 GET_TEST_USER = """
@@ -65,46 +65,17 @@ GET_TEST_USER = """
 """
 
 # Stored procedure calls
-CREATE_TASK_PROCEDURE = """
-    SET NOCOUNT ON;
-    DECLARE @NewInstanceId INT;
-    EXEC [QTasks3].[dbo].[QCheck_CreateTaskThroughChatbot]
-        @TaskName=N'{task_name}',
-        @MainController=N'{main_controller}',
-        @Controllers=N'{controllers}',
-        @Assignees=N'{assignees}',
-        @DueDate='{due_date}',
-        @LocalDueDate='{local_due_date}',
-        @Location=N'{location}',
-        @DueTime={due_time},
-        @SoftDueDate='{soft_due_date}',
-        @FinalDueDate='{final_due_date}',
-        @Items=N'{items}',
-        @IsRecurring={is_recurring},
-        @FreqType={freq_type},
-        @FreqRecurrance={freq_recurrance},
-        @FreqInterval={freq_interval},
-        @BusinessDayBehavior={business_day_behavior},
-        @Activate={activate},
-        @IsReminder={is_reminder},
-        @ReminderDate='{reminder_date}',
-        @AddToPriorityList={add_to_priority_list},
-        @NewInstanceId=@NewInstanceId OUTPUT;
-    SELECT @NewInstanceId AS CreatedInstanceID;
-"""
-
 ADD_TO_PRIORITY_LIST_PROCEDURE = """
     EXEC PriorityList_AddTask 
         @UserID = %s, 
         @ActiveChecklistID = %s
 """
 
-# Parameterized stored procedure call (safer for retry scenarios)
-CREATE_TASK_PROCEDURE_PARAMETERIZED = """
-    SET NOCOUNT ON;
-    DECLARE @NewInstanceId INT;
+# Task creation procedure EXEC shared by the batches below (expects @TaskName
+# and @NewInstanceId declared)
+_CREATE_TASK_PROC = """
     EXEC [QTasks3].[dbo].[QCheck_CreateTaskThroughChatbot]
-        @TaskName=%s,
+        @TaskName=@TaskName,
         @MainController=%s,
         @Controllers=%s,
         @Assignees=%s,
@@ -125,5 +96,91 @@ CREATE_TASK_PROCEDURE_PARAMETERIZED = """
         @ReminderDate=%s,
         @AddToPriorityList=%s,
         @NewInstanceId=@NewInstanceId OUTPUT;
+"""
+
+# If the procedure returns without an instance ID, fall back to the latest
+# instance of a checklist with the same name (same lookup as FIND_TASK_BY_NAME)
+_FIND_TASK_FALLBACK = """
+    IF @NewInstanceId IS NULL
+        SELECT TOP 1 @NewInstanceId = ci.ID
+        FROM QCheck_ChecklistInstances ci
+        INNER JOIN QCheck_Checklists c ON ci.ChecklistID = c.ID
+        WHERE c.Name = @TaskName
+        ORDER BY ci.ID DESC;
+"""
+
+_CREATE_TASK_CALL = _CREATE_TASK_PROC + _FIND_TASK_FALLBACK
+
+# Same call with @TaskName declared from the first parameter
+_CREATE_TASK_EXEC = """
+    DECLARE @TaskName NVARCHAR(500) = %s;
+""" + _CREATE_TASK_CALL
+
+# Task creation stored procedure call (always parameterized)
+CREATE_TASK_PROCEDURE_PARAMETERIZED = """
+    SET NOCOUNT ON;
+    DECLARE @NewInstanceId INT;
+""" + _CREATE_TASK_EXEC + """
     SELECT @NewInstanceId AS CreatedInstanceID;
+"""
+
+# UC08 task creation. Same parameters and result as
+# CREATE_TASK_PROCEDURE_PARAMETERIZED plus CreatedByProcedure, which is 0 when the
+# instance ID came from the name fallback and may belong to an older checklist.
+CREATE_TASK_WITH_TRANSLATION = """
+    SET NOCOUNT ON;
+    DECLARE @NewInstanceId INT, @CreatedByProcedure BIT;
+    DECLARE @TaskName NVARCHAR(500) = %s;
+""" + _CREATE_TASK_PROC + """
+    SET @CreatedByProcedure = CASE WHEN @NewInstanceId IS NULL THEN 0 ELSE 1 END;
+""" + _FIND_TASK_FALLBACK + """
+    SELECT @NewInstanceId AS CreatedInstanceID, @CreatedByProcedure AS CreatedByProcedure;
+"""
+
+# UC08: store translation metadata already linked to the created instance.
+# Takes the 7 metadata columns followed by the instance ID.
+STORE_LINKED_TRANSLATION_METADATA = """
+    SET NOCOUNT ON;
+    INSERT INTO UC08_TranslationMetadata
+        (TaskName, EncodingMethod, OriginalBitmask, EncodedValue, Day, CreatedBy, Notes,
+         InstanceID, ChecklistID)
+    SELECT %s, %s, %s, %s, %s, %s, %s, ci.ID, ci.ChecklistID
+    FROM QCheck_ChecklistInstances ci
+    WHERE ci.ID = %s;
+    SELECT SCOPE_IDENTITY() AS TranslationID;
+"""
+
+# Batched task creation: CREATE_TASK_BULK_HEADER followed by one
+# CREATE_TASK_BULK_ROW (20 task parameters each) per task, so several tasks are
+# created in one round-trip. Each row yields its own one-row result set of
+# (CreatedInstanceID, ErrorMessage). A task whose procedure call fails reports
+# its error and ends the batch, so later tasks were not attempted; earlier tasks
+# stay created.
+CREATE_TASK_BULK_HEADER = """
+    SET NOCOUNT ON;
+    DECLARE @TaskName NVARCHAR(500), @NewInstanceId INT;
+"""
+
+CREATE_TASK_BULK_ROW = """
+    SELECT @TaskName = %s, @NewInstanceId = NULL;
+    BEGIN TRY
+""" + _CREATE_TASK_PROC + """
+    END TRY
+    BEGIN CATCH
+        IF XACT_STATE() = -1
+            ROLLBACK TRANSACTION;
+        -- The procedure's cursors are global by default; an error inside one of
+        -- its loops skips CLOSE/DEALLOCATE and would break every later call on
+        -- this (pooled) connection
+        IF CURSOR_STATUS('global', 'groupCursor') >= 0 CLOSE groupCursor;
+        IF CURSOR_STATUS('global', 'groupCursor') >= -1 DEALLOCATE groupCursor;
+        IF CURSOR_STATUS('global', 'assigneeCursor') >= 0 CLOSE assigneeCursor;
+        IF CURSOR_STATUS('global', 'assigneeCursor') >= -1 DEALLOCATE assigneeCursor;
+        IF CURSOR_STATUS('global', 'itemsCursor') >= 0 CLOSE itemsCursor;
+        IF CURSOR_STATUS('global', 'itemsCursor') >= -1 DEALLOCATE itemsCursor;
+        SELECT NULL AS CreatedInstanceID, ERROR_MESSAGE() AS ErrorMessage;
+        RETURN;
+    END CATCH
+""" + _FIND_TASK_FALLBACK + """
+    SELECT @NewInstanceId AS CreatedInstanceID, NULL AS ErrorMessage;
 """
\ No newline at end of file
@@ -36,6 +36,7 @@ API_SETTINGS: Dict[str, Any] = {
     # Logging settings
     'LOG_LEVEL': os.getenv('LOG_LEVEL', 'INFO'),
     'LOG_REQUEST_DETAILS': os.getenv('LOG_REQUEST_DETAILS', 'false').lower() == 'true',
+    'LOG_STRUCTURED_ERRORS': os.getenv('LOG_STRUCTURED_ERRORS', 'false').lower() == 'true',
     
     # Feature flags
     'ENABLE_DEBUG_MODE': os.getenv('ENABLE_DEBUG_MODE', 'false').lower() == 'true',
@@ -44,7 +45,12 @@ API_SETTINGS: Dict[str, Any] = {
     
     # Cache settings
     'CACHE_TTL_SECONDS': 300,  # 5 minutes
-    'ENABLE_RESPONSE_CACHING': False,
+    # Reuse AI extraction responses for identical prompts and history
+    'ENABLE_RESPONSE_CACHING': os.getenv('ENABLE_RESPONSE_CACHING', 'true').lower() == 'true',
+    
+    # Batch task creation: worker threads for tasks that need their own
+    # stored procedure round-trip; each worker opens its own DB connection
+    'BATCH_CREATE_WORKERS': int(os.getenv('BATCH_CREATE_WORKERS', '4')),
     
     # Security settings
     'ENABLE_CSRF_PROTECTION': True,
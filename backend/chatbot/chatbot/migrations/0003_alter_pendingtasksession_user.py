@@ -0,0 +1,18 @@
+# Generated by Django 4.2.11 on 2026-10-15 23:10
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('chatbot', '0002_pendingtasksession'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='pendingtasksession',
+            name='user',
+            field=models.CharField(db_index=True, max_length=255),
+        ),
+    ]
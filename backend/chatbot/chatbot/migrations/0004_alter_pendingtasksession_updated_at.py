@@ -0,0 +1,18 @@
+# Generated by Django 4.2.11 on 2026-10-15 23:20
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('chatbot', '0003_alter_pendingtasksession_user'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='pendingtasksession',
+            name='updated_at',
+            field=models.DateTimeField(auto_now=True, db_index=True),
+        ),
+    ]
@@ -34,8 +34,8 @@ class Task(models.Model):
         return f"{self.title} for {self.user.name}"
 
 class PendingTaskSession(models.Model):
-    user = models.CharField(max_length=255)  # Username string
+    user = models.CharField(max_length=255, db_index=True)  # Username string
     parameters = models.JSONField(default=dict)  # Collected parameters so far
     last_prompt = models.TextField(blank=True, null=True)
     created_at = models.DateTimeField(auto_now_add=True)
-    updated_at = models.DateTimeField(auto_now=True)
+    updated_at = models.DateTimeField(auto_now=True, db_index=True)
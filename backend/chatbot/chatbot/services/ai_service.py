@@ -6,6 +6,7 @@ including Claude API integration, request handling, and response processing.
 """
 
 import os
+import hashlib
 import json
 import re
 import time
@@ -14,12 +15,20 @@ import requests
 import csv
 from datetime import datetime
 from typing import Dict, Any, Tuple, Optional, List
+from django.core.cache import cache
 
 from ..config.prompts import SystemPrompts, PromptHints
+from ..config.settings import API_SETTINGS
 from .error_handler import error_handler, AIServiceError, retry_ai_service_call
 
 logger = logging.getLogger(__name__)
 
+# Extraction responses are cached under a hash of everything sent to the model
+# (model, system prompt and history), so only byte-identical requests hit
+EXTRACTION_CACHE_KEY_PREFIX = 'qprocess:extraction:'
+EXTRACTION_CACHE_TTL = API_SETTINGS['CACHE_TTL_SECONDS']
+_RESPONSE_CACHING = API_SETTINGS['ENABLE_RESPONSE_CACHING']
+
 
 # AIServiceError is now imported from error_handler
 
@@ -287,19 +296,32 @@ class AIService:
         
         logger.debug(f"Validated history with {len(validated_history)} messages")
         
-        # Send request to Claude
-        try:
-            success, response_data = self.send_request_to_claude(
-                validated_history, system_prompt, timeout, debug_mode
-            )
-        except AIServiceError as e:
-            error_handler.log_error(e, {'operation': 'task_extraction', 'message_length': message_length})
-            return False, {}, str(e)
-        
-        if not success:
-            return False, {}, response_data.get('error', 'Unknown error')
-        
-        content = response_data['content']
+        content = None
+        if _RESPONSE_CACHING:
+            cache_key = EXTRACTION_CACHE_KEY_PREFIX + hashlib.blake2b(
+                json.dumps([self.model, system_prompt, validated_history], sort_keys=True, default=str).encode('utf-8'),
+                digest_size=16
+            ).hexdigest()
+            content = cache.get(cache_key)
+            if content is not None:
+                logger.info("Reusing cached AI response for an identical extraction request")
+        
+        if content is None:
+            # Send request to Claude
+            try:
+                success, response_data = self.send_request_to_claude(
+                    validated_history, system_prompt, timeout, debug_mode
+                )
+            except AIServiceError as e:
+                error_handler.log_error(e, {'operation': 'task_extraction', 'message_length': message_length})
+                return False, {}, str(e)
+            
+            if not success:
+                return False, {}, response_data.get('error', 'Unknown error')
+            
+            content = response_data['content']
+            if _RESPONSE_CACHING:
+                cache.set(cache_key, content, EXTRACTION_CACHE_TTL)
         
         # Parse JSON from response
         is_json_response, parsed_json = self.parse_json_response(content)
@@ -312,7 +334,8 @@ class AIService:
             logger.info(f"LLM JSON params: {parsed_json}")
             
             # Special debug for UC08 monthly pattern
-            if "on the" in user_message.lower() and "month" in user_message.lower():
+            msg_lower = user_message.lower()
+            if "on the" in msg_lower and "month" in msg_lower:
                 logger.warning(f"UC08 PATTERN DETECTED: Monthly with specific day")
                 logger.warning(f"User message: {user_message}")
                 logger.warning(f"Claude's FreqType: {parsed_json.get('FreqType')}")
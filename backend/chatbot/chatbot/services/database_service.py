@@ -5,16 +5,47 @@ This module encapsulates all database operations, providing a clean interface
 for database interactions with proper resource management and error handling.
 """
 
+import difflib
+import hashlib
 import logging
-from django.db import connection
+import re
+import threading
+import time
+from django.core.cache import cache
+from django.db import connection, ProgrammingError
 from contextlib import contextmanager
-from typing import Optional, List, Tuple, Dict, Any
+from typing import Optional, List, Tuple, Dict, Set, Any, Iterator
 from ..config.queries import *
+from ..config.settings import API_SETTINGS
 from .error_handler import error_handler, DatabaseError, retry_database_operation
 from .bitmask_translator import get_translator
 
 logger = logging.getLogger(__name__)
 
+# Cache keys for lookups that rarely change between chatbot turns
+ACTIVE_USERS_CACHE_KEY = 'qprocess:active_users'
+ALL_ACTIVE_USERS_CACHE_KEY = 'qprocess:all_active_users'
+GROUP_CACHE_KEY_PREFIX = 'qprocess:group:'
+LOOKUP_CACHE_TTL = API_SETTINGS['CACHE_TTL_SECONDS']
+
+# In-process snapshot of group names ({lowercased name: stored name}) and a
+# trigram index over it, reloaded every LOOKUP_CACHE_TTL seconds
+_group_index: Tuple[Dict[str, str], Dict[str, Set[str]]] = ({}, {})
+_group_index_loaded_at = 0.0
+
+# UC08 translator; building it only fills in-memory lookup tables, so it is safe at import
+_translator = get_translator()
+
+# Per-thread cursor reused by get_read_cursor()
+_cursor_tls = threading.local()
+
+# Tasks per create_tasks_bulk() request; each task takes 20 parameters and
+# SQL Server accepts at most 2100 per request
+_BULK_CREATE_MAX_TASKS = 100
+
+# Task names that get extra UC08 logging: 'UC08', or 'month' (any case) together with '15'
+_UC08_TASK_NAME_PATTERN = re.compile(r'UC08|(?i:month).*15|15.*(?i:month)', re.DOTALL)
+
 
 class DatabaseService:
     """
@@ -26,7 +57,8 @@ class DatabaseService:
     @staticmethod
     def escape_sql_string(s):
         """
-        Helper function to safely escape strings for SQL
+        Helper function to safely escape strings for SQL.
+        Kept for legacy callers; task creation uses parameterized queries.
         """
         if s is None:
             return "NULL"
@@ -34,13 +66,21 @@ class DatabaseService:
     
     @staticmethod
     @contextmanager
-    def get_cursor():
+    def get_cursor(drain: bool = False, fast_executemany: bool = False):
         """
         Context manager for database cursors with proper cleanup
+        
+        Args:
+            drain: Consume any remaining result sets before closing. Only needed
+                for stored procedure calls that can return multiple result sets.
+            fast_executemany: Send executemany() parameter sets in a single
+                round-trip (pyodbc parameter arrays) instead of one per row.
         """
         cursor = None
         try:
             cursor = connection.cursor()
+            if fast_executemany:
+                DatabaseService._enable_fast_executemany(cursor)
             yield cursor
         except Exception as e:
             logger.error(f"Database cursor error: {e}")
@@ -48,18 +88,88 @@ class DatabaseService:
         finally:
             if cursor:
                 try:
-                    # Consume any remaining results to clear the cursor
-                    while cursor.nextset():
-                        pass
-                except:
-                    pass
+                    if drain:
+                        # Consume any remaining results to clear the cursor
+                        while cursor.nextset():
+                            pass
+                except ProgrammingError as e:
+                    logger.debug(f"No further result sets to drain: {e}")
                 finally:
                     cursor.close()
     
+    @staticmethod
+    @contextmanager
+    def get_read_cursor():
+        """
+        Context manager for a per-thread cursor reused across read-only queries.
+        The cursor is replaced whenever Django has reconnected since it was
+        opened. Writes and stored procedure calls should use get_cursor().
+        
+        Any results the caller left unread are discarded on exit: without MARS
+        an open result set keeps the connection busy for every other statement.
+        """
+        cursor = getattr(_cursor_tls, 'cursor', None)
+        try:
+            if cursor is None or _cursor_tls.raw_connection is not connection.connection:
+                if cursor is not None:
+                    DatabaseService._close_quietly(cursor)
+                cursor = connection.cursor()
+                _cursor_tls.cursor = cursor
+                _cursor_tls.raw_connection = connection.connection
+            yield cursor
+            try:
+                while cursor.nextset():
+                    pass
+            except ProgrammingError as e:
+                logger.debug(f"No further result sets to drain: {e}")
+        except Exception as e:
+            # Don't hand a cursor in an unknown state to the next query
+            _cursor_tls.cursor = None
+            if cursor:
+                DatabaseService._close_quietly(cursor)
+            logger.error(f"Database cursor error: {e}")
+            raise DatabaseError(f"Database connection error: {str(e)}", 'DATABASE_CONNECTION_ERROR')
+    
+    @staticmethod
+    def _close_quietly(cursor):
+        """Close a cursor whose connection may already be gone."""
+        try:
+            cursor.close()
+        except Exception:
+            pass
+    
+    @staticmethod
+    def _enable_fast_executemany(cursor):
+        """Turn on fast_executemany on the driver cursor behind Django's wrappers."""
+        # The Django and mssql wrappers delegate attribute reads but not writes,
+        # so the flag has to be set on the underlying pyodbc cursor itself
+        raw_cursor = cursor
+        while not isinstance(raw_cursor, connection.Database.Cursor) and hasattr(raw_cursor, 'cursor'):
+            raw_cursor = raw_cursor.cursor
+        if hasattr(raw_cursor, 'fast_executemany'):
+            raw_cursor.fast_executemany = True
+    
+    @staticmethod
+    def iter_rows(cursor, batch_size: int = 1000) -> Iterator[Tuple[Any, ...]]:
+        """
+        Yield rows from an executed cursor in fetchmany batches, so large result
+        sets are not materialized as one list before being processed.
+        
+        Args:
+            cursor: Cursor with a pending result set
+            batch_size: Number of rows fetched per round-trip
+            
+        Yields:
+            Result rows
+        """
+        for batch in iter(lambda: cursor.fetchmany(batch_size), []):
+            yield from batch
+    
     @staticmethod
     def validate_group_exists(group_name: str) -> Tuple[bool, Optional[str], List[str]]:
         """
         Validate if a group exists and provide suggestions if not found.
+        Results (including misses with their suggestions) are cached briefly.
         
         Args:
             group_name: Name of the group to validate
@@ -67,78 +177,157 @@ class DatabaseService:
         Returns:
             Tuple of (exists, found_name, similar_groups)
         """
+        cache_key = GROUP_CACHE_KEY_PREFIX + hashlib.md5(group_name.lower().encode('utf-8')).hexdigest()
+        cached = cache.get(cache_key)
+        if cached is not None:
+            return cached
+        
         try:
-            with DatabaseService.get_cursor() as cursor:
-                # Check if group exists
-                cursor.execute(CHECK_GROUP_EXISTS, [group_name])
-                group_row = cursor.fetchone()
-                
+            group_names, group_trigrams = DatabaseService._get_group_index()
+            found_name = group_names.get(group_name.strip().lower())
+            
+            if found_name is None:
+                # Groups created since the last snapshot are only visible to SQL
+                with DatabaseService.get_read_cursor() as cursor:
+                    cursor.execute(CHECK_GROUP_EXISTS, [group_name])
+                    group_row = cursor.fetchone()
                 if group_row:
-                    return True, group_row[0], []
-                
-                # Find similar groups for suggestions
-                cursor.execute(FIND_SIMILAR_GROUPS, [f'%{group_name.split()[0]}%'])
-                similar_groups = [row[0] for row in cursor.fetchall()]
-                
-                return False, None, similar_groups
+                    found_name = group_row[0]
+            
+            if found_name is not None:
+                result = (True, found_name, [])
+            else:
+                result = (False, None, DatabaseService._find_similar_groups(group_name, group_names, group_trigrams))
+            
+            cache.set(cache_key, result, LOOKUP_CACHE_TTL)
+            return result
                 
         except Exception as e:
             error_handler.log_error(e, {'group_name': group_name, 'operation': 'validate_group'})
             logger.error(f"Error validating group '{group_name}': {e}")
             return False, None, []
     
+    @staticmethod
+    def _get_group_index() -> Tuple[Dict[str, str], Dict[str, Set[str]]]:
+        """
+        Return the group name snapshot, reloading it once it is older than LOOKUP_CACHE_TTL.
+        
+        Returns:
+            Tuple of ({lowercased name: stored name}, {trigram: lowercased names containing it})
+        """
+        global _group_index, _group_index_loaded_at
+        
+        if not _group_index[0] or time.monotonic() - _group_index_loaded_at > LOOKUP_CACHE_TTL:
+            with DatabaseService.get_read_cursor() as cursor:
+                cursor.execute(LIST_ALL_GROUPS)
+                group_names = {row[0].strip().lower(): row[0] for row in DatabaseService.iter_rows(cursor) if row[0]}
+            
+            group_trigrams: Dict[str, Set[str]] = {}
+            for key in group_names:
+                for trigram in DatabaseService._trigrams(key):
+                    group_trigrams.setdefault(trigram, set()).add(key)
+            
+            # Swap both halves in together so readers never see a mismatched pair
+            _group_index = (group_names, group_trigrams)
+            _group_index_loaded_at = time.monotonic()
+            logger.debug(f"Loaded {len(group_names)} group names ({len(group_trigrams)} trigrams)")
+        
+        return _group_index
+    
+    @staticmethod
+    def _trigrams(text: str) -> Set[str]:
+        """Return the set of 3-character substrings of text."""
+        return {text[i:i + 3] for i in range(len(text) - 2)}
+    
+    @staticmethod
+    def _find_similar_groups(group_name: str, group_names: Dict[str, str],
+                             group_trigrams: Dict[str, Set[str]], limit: int = 5) -> List[str]:
+        """
+        Suggest groups for a name that was not found.
+        Prefers groups containing the first word of the name, then falls back
+        to fuzzy matching to catch typos.
+        """
+        first_word = group_name.split()[0].lower()
+        
+        # Any name containing first_word contains all of its trigrams, so the
+        # posting-list intersection narrows the substring check to a few candidates
+        trigrams = DatabaseService._trigrams(first_word)
+        if trigrams:
+            postings = sorted((group_trigrams.get(trigram, set()) for trigram in trigrams), key=len)
+            candidates = set.intersection(*postings)
+        else:
+            candidates = group_names.keys()
+        
+        similar = sorted((group_names[key] for key in candidates if first_word in key), key=str.lower)[:limit]
+        if not similar:
+            close_keys = difflib.get_close_matches(group_name.strip().lower(), group_names.keys(), n=limit)
+            similar = [group_names[key] for key in close_keys]
+        return similar
+    
     @staticmethod
     def get_active_users() -> List[str]:
         """
         Get list of properly configured active users who can create tasks.
         Only returns users who exist as both users and groups.
+        Results are cached for LOOKUP_CACHE_TTL seconds.
         
         Returns:
             List of user full names who are properly configured
         """
         try:
-            with DatabaseService.get_cursor() as cursor:
-                cursor.execute(GET_ACTIVE_USERS)
-                users = [row[0] for row in cursor.fetchall()]
-                
-                logger.info(f"Retrieved {len(users)} properly configured users")
-                
-                # Log configuration rate for monitoring
-                cursor.execute("SELECT COUNT(*) FROM [QTasks3].[dbo].[QCheck_Users] WHERE isdeleted <> 1")
-                total_active = cursor.fetchone()[0]
-                config_rate = (len(users) / total_active * 100) if total_active > 0 else 0
-                logger.info(f"User configuration rate: {config_rate:.1f}% ({len(users)}/{total_active})")
-                
-                return users
+            return cache.get_or_set(ACTIVE_USERS_CACHE_KEY, DatabaseService._fetch_active_users, LOOKUP_CACHE_TTL)
                 
         except Exception as e:
             error_handler.log_error(e, {'operation': 'get_active_users'})
             logger.error(f"Error retrieving active users: {e}")
             return []
     
+    @staticmethod
+    def _fetch_active_users() -> List[str]:
+        """Load the configured active users from the database (uncached)."""
+        with DatabaseService.get_read_cursor() as cursor:
+            cursor.execute(GET_ACTIVE_USERS)
+            users = []
+            total_active = 0
+            for full_name, total_active in DatabaseService.iter_rows(cursor):
+                users.append(full_name)
+            
+            logger.info(f"Retrieved {len(users)} properly configured users")
+            
+            # Log configuration rate for monitoring
+            config_rate = (len(users) / total_active * 100) if total_active > 0 else 0
+            logger.info(f"User configuration rate: {config_rate:.1f}% ({len(users)}/{total_active})")
+            
+            return users
+    
     @staticmethod
     def get_all_active_users() -> List[str]:
         """
         Get list of ALL active users (legacy method).
         This includes users who may not be properly configured for task creation.
+        Results are cached for LOOKUP_CACHE_TTL seconds.
         
         Returns:
             List of all active user full names
         """
         try:
-            with DatabaseService.get_cursor() as cursor:
-                from ..config.queries import GET_ALL_ACTIVE_USERS_LEGACY
-                cursor.execute(GET_ALL_ACTIVE_USERS_LEGACY)
-                users = [row[0] for row in cursor.fetchall()]
-                
-                logger.info(f"Retrieved {len(users)} total active users (legacy)")
-                return users
+            return cache.get_or_set(ALL_ACTIVE_USERS_CACHE_KEY, DatabaseService._fetch_all_active_users, LOOKUP_CACHE_TTL)
                 
         except Exception as e:
             error_handler.log_error(e, {'operation': 'get_all_active_users'})
             logger.error(f"Error retrieving all active users: {e}")
             return []
     
+    @staticmethod
+    def _fetch_all_active_users() -> List[str]:
+        """Load all active users from the database (uncached)."""
+        with DatabaseService.get_read_cursor() as cursor:
+            cursor.execute(GET_ALL_ACTIVE_USERS_LEGACY)
+            users = [row[0] for row in DatabaseService.iter_rows(cursor)]
+            
+            logger.info(f"Retrieved {len(users)} total active users (legacy)")
+            return users
+    
     @staticmethod
     def find_task_by_name(task_name: str) -> Optional[int]:
         """
@@ -151,7 +340,7 @@ class DatabaseService:
             Task instance ID if found, None otherwise
         """
         try:
-            with DatabaseService.get_cursor() as cursor:
+            with DatabaseService.get_read_cursor() as cursor:
                 cursor.execute(FIND_TASK_BY_NAME, [task_name])
                 result = cursor.fetchone()
                 
@@ -171,8 +360,9 @@ class DatabaseService:
     @staticmethod
     def create_task_via_stored_procedure(params: Dict[str, Any]) -> Optional[int]:
         """
-        Create a task using the stored procedure with string interpolation.
-        This method handles the main task creation logic with UC08 translation support.
+        Create a task using the stored procedure.
+        This method handles the main task creation logic with UC08 translation support
+        and always executes the parameterized procedure call.
         
         Args:
             params: Dictionary containing all task parameters
@@ -180,115 +370,39 @@ class DatabaseService:
         Returns:
             Instance ID of created task, None if failed
         """
-        translator = get_translator()
         translation_metadata = None
-        translation_id = None
+        task_name = params.get('TaskName', '')
         
         try:
             # Check if UC08 translation is needed
-            freq_type = params.get('FreqType')
             freq_recurrence = params.get('FreqRecurrance')
             
-            if translator.needs_translation(freq_recurrence, freq_type):
+            if _translator.needs_translation(freq_recurrence, params.get('FreqType')):
                 logger.info(f"UC08 Translation required for FreqRecurrance {freq_recurrence}")
                 
-                # Encode parameters for database
-                params, translation_metadata = translator.encode_for_database(params)
-                
-                # Store translation metadata
-                translation_id = translator.store_translation_metadata(translation_metadata)
+                # Encode parameters for database; metadata is stored with the task below
+                params, translation_metadata = _translator.encode_for_database(params)
                 
-                logger.info(f"UC08 Translation applied: {freq_recurrence} -> {params.get('FreqRecurrance')}")
+                logger.info(f"UC08 Translation applied: {freq_recurrence} -> {translation_metadata['encoded_value']}")
             
             # Continue with normal task creation using (possibly translated) parameters
-            # Build SQL query with proper escaping
-            sql_query = CREATE_TASK_PROCEDURE.format(
-                task_name=DatabaseService.escape_sql_string(params.get('TaskName', '')),
-                main_controller=DatabaseService.escape_sql_string(params.get('MainController', '')),
-                controllers=DatabaseService.escape_sql_string(params.get('Controllers', '')),
-                assignees=DatabaseService.escape_sql_string(params.get('Assignees', '')),
-                due_date=DatabaseService.escape_sql_string(params.get('DueDate', '')),
-                local_due_date=DatabaseService.escape_sql_string(params.get('LocalDueDate', '')),
-                location=DatabaseService.escape_sql_string(params.get('Location', 'New York')),
-                due_time=params.get('DueTime', 19000),
-                soft_due_date=DatabaseService.escape_sql_string(params.get('SoftDueDate', '')),
-                final_due_date=DatabaseService.escape_sql_string(params.get('FinalDueDate', '')),
-                items=DatabaseService.escape_sql_string(params.get('Items', '')),
-                is_recurring=params.get('IsRecurring', 0),
-                freq_type=params.get('FreqType', 'NULL') if params.get('FreqType') is not None else 'NULL',
-                freq_recurrance=params.get('FreqRecurrance', 'NULL') if params.get('FreqRecurrance') is not None else 'NULL',
-                freq_interval=params.get('FreqInterval', 'NULL') if params.get('FreqInterval') is not None else 'NULL',
-                business_day_behavior=params.get('BusinessDayBehavior', 1),
-                activate=params.get('Activate', 1),
-                is_reminder=params.get('IsReminder', 0),
-                reminder_date=DatabaseService.escape_sql_string(params.get('ReminderDate', '')),
-                add_to_priority_list=params.get('AddToPriorityList', 0)
-            )
-            
-            logger.debug(f"Executing stored procedure for task: {params.get('TaskName')}")
-            
-            # Check for large FreqRecurrance values that might cause issues
-            freq_recurrance = params.get('FreqRecurrance')
-            if freq_recurrance is not None and isinstance(freq_recurrance, int) and freq_recurrance >= 16384:
-                logger.warning(f"Large FreqRecurrance detected ({freq_recurrance}), using parameterized query")
-                # Build parameter list for parameterized query
-                param_list = [
-                    params.get('TaskName', ''),
-                    params.get('MainController', ''),
-                    params.get('Controllers', ''),
-                    params.get('Assignees', ''),
-                    params.get('DueDate', ''),
-                    params.get('LocalDueDate', ''),
-                    params.get('Location', 'New York'),
-                    params.get('DueTime', 19000),
-                    params.get('SoftDueDate', ''),
-                    params.get('FinalDueDate', ''),
-                    params.get('Items', ''),
-                    params.get('IsRecurring', 0),
-                    params.get('FreqType') if params.get('FreqType') is not None else None,
-                    params.get('FreqRecurrance') if params.get('FreqRecurrance') is not None else None,
-                    params.get('FreqInterval') if params.get('FreqInterval') is not None else None,
-                    params.get('BusinessDayBehavior', 1),
-                    params.get('Activate', 1),
-                    params.get('IsReminder', 0),
-                    params.get('ReminderDate', ''),
-                    params.get('AddToPriorityList', 0)
-                ]
-                return DatabaseService.create_task_via_stored_procedure_parameterized(param_list)
+            param_list = DatabaseService.build_task_param_list(params)
+            
+            logger.debug(f"Executing stored procedure for task: {task_name}")
             
             # Special logging for UC08 pattern
-            task_name = params.get('TaskName', '')
-            if 'UC08' in task_name or ('month' in task_name.lower() and '15' in task_name):
+            if _UC08_TASK_NAME_PATTERN.search(task_name):
+                freq_type, freq_recurrence, freq_interval = param_list[12:15]
                 logger.warning("UC08 PATTERN: Monthly task with specific day")
-                logger.warning(f"FreqType: {params.get('FreqType')}")
-                logger.warning(f"FreqRecurrance: {params.get('FreqRecurrance')}")
-                logger.warning(f"FreqInterval: {params.get('FreqInterval')}")
-                logger.warning(f"Full SQL Query: {sql_query[:500]}...")
+                logger.warning(f"FreqType: {freq_type}")
+                logger.warning(f"FreqRecurrance: {freq_recurrence}")
+                logger.warning(f"FreqInterval: {freq_interval}")
             
-            with DatabaseService.get_cursor() as cursor:
-                cursor.execute(sql_query)
-                
-                # Try to get the instance ID
-                if cursor.description is not None:
-                    result = cursor.fetchone()
-                    if result and result[0] is not None:
-                        instance_id = result[0]
-                        logger.info(f"Task created successfully with ID: {instance_id}")
-                        
-                        # Link translation metadata to the created task
-                        if translation_id and instance_id:
-                            translator.link_translation_to_task(translation_id, instance_id)
-                            logger.info(f"UC08 Translation linked: metadata ID {translation_id} -> task ID {instance_id}")
-                        
-                        return instance_id
-                
-                logger.warning("No instance ID returned from stored procedure")
-                return None
+            return DatabaseService.create_task_via_stored_procedure_parameterized(param_list, translation_metadata)
                 
         except Exception as e:
-            error_handler.log_error(e, {'task_name': params.get('TaskName'), 'operation': 'create_task_via_stored_procedure'})
+            error_handler.log_error(e, {'task_name': task_name, 'operation': 'create_task_via_stored_procedure'})
             logger.error(f"Error creating task via stored procedure: {e}")
-            logger.error(f"SQL Query that failed: {sql_query[:500]}...")
             
             # Check if this was a translated UC08 task that still failed
             # This might indicate a deeper issue beyond just the 16384 limitation
@@ -297,43 +411,90 @@ class DatabaseService:
                 logger.error(f"UC08 translated task still failed for day {day}")
                 # Continue with normal error handling - translation didn't solve the issue
             
-            raise DatabaseError(f"Task creation failed: {str(e)}", 'TASK_CREATION_FAILED')
+            raise DatabaseError(f"Task creation failed: {str(e)}", 'TASK_CREATION_FAILED') from e
+    
+    @staticmethod
+    def build_task_param_list(params: Dict[str, Any]) -> List[Any]:
+        """
+        Build the ordered parameter list for CREATE_TASK_PROCEDURE_PARAMETERIZED.
+        
+        Args:
+            params: Dictionary containing all task parameters
+            
+        Returns:
+            List of parameters in stored procedure order
+        """
+        return [
+            params.get('TaskName', ''),
+            params.get('MainController', ''),
+            params.get('Controllers', ''),
+            params.get('Assignees', ''),
+            params.get('DueDate', ''),
+            params.get('LocalDueDate', ''),
+            params.get('Location', 'New York'),
+            params.get('DueTime', 19000),
+            params.get('SoftDueDate', ''),
+            params.get('FinalDueDate', ''),
+            params.get('Items', ''),
+            params.get('IsRecurring', 0),
+            params.get('FreqType'),
+            params.get('FreqRecurrance'),
+            params.get('FreqInterval'),
+            params.get('BusinessDayBehavior', 1),
+            params.get('Activate', 1),
+            params.get('IsReminder', 0),
+            params.get('ReminderDate', ''),
+            params.get('AddToPriorityList', 0)
+        ]
     
     @staticmethod
-    def create_task_via_stored_procedure_parameterized(param_list: List[Any]) -> Optional[int]:
+    def create_task_via_stored_procedure_parameterized(param_list: List[Any],
+                                                       translation_metadata: Optional[Dict[str, Any]] = None) -> Optional[int]:
         """
         Create a task using parameterized stored procedure call.
         This is safer for retry scenarios and special cases.
         
         Args:
             param_list: List of parameters in the correct order
+            translation_metadata: UC08 translation metadata; when given, it is stored
+                and linked to the new task afterwards on a best-effort basis
             
         Returns:
             Instance ID of created task, None if failed
         """
         try:
-            logger.debug(f"Executing parameterized stored procedure")
-            logger.debug(f"Parameter list: {param_list}")
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("Executing parameterized stored procedure")
+                logger.debug(f"Parameter list: {param_list}")
+                
+                # Log specific parameters of interest
+                if len(param_list) >= 14:
+                    logger.debug(f"FreqType (param 12): {param_list[12]}")
+                    logger.debug(f"FreqRecurrance (param 13): {param_list[13]}")
+                    logger.debug(f"FreqInterval (param 14): {param_list[14]}")
             
-            # Log specific parameters of interest
-            if len(param_list) >= 14:
-                logger.debug(f"FreqType (param 12): {param_list[12]}")
-                logger.debug(f"FreqRecurrance (param 13): {param_list[13]}")
-                logger.debug(f"FreqInterval (param 14): {param_list[14]}")
+            query = CREATE_TASK_WITH_TRANSLATION if translation_metadata else CREATE_TASK_PROCEDURE_PARAMETERIZED
             
-            with DatabaseService.get_cursor() as cursor:
-                cursor.execute(CREATE_TASK_PROCEDURE_PARAMETERIZED, param_list)
+            with DatabaseService.get_cursor(drain=True) as cursor:
+                cursor.execute(query, param_list)
                 
                 # Try to get the instance ID
-                if cursor.description is not None:
+                try:
                     result = cursor.fetchone()
-                    if result and result[0] is not None:
-                        instance_id = result[0]
-                        logger.info(f"Task created successfully (parameterized) with ID: {instance_id}")
-                        return instance_id
-                
-                logger.warning("No instance ID returned from parameterized stored procedure")
-                return None
+                except ProgrammingError:
+                    # The batch produced no result set
+                    result = None
+            
+            if result and result[0] is not None:
+                instance_id = result[0]
+                logger.info(f"Task created successfully (parameterized) with ID: {instance_id}")
+                # Don't link metadata to an older checklist found by the name fallback
+                if translation_metadata and result[1]:
+                    DatabaseService._store_translation_metadata(translation_metadata, instance_id)
+                return instance_id
+            
+            logger.warning("No instance ID returned from parameterized stored procedure")
+            return None
                 
         except Exception as e:
             error_handler.log_error(e, {'operation': 'create_task_via_parameterized_stored_procedure'})
@@ -344,8 +505,7 @@ class DatabaseService:
                 freq_type = param_list[12]
                 freq_recurrance = param_list[13]
                 if freq_type == 3 and freq_recurrance and isinstance(freq_recurrance, int) and freq_recurrance >= 16384:
-                    import math
-                    day = int(math.log2(freq_recurrance)) + 1
+                    day = freq_recurrance.bit_length()
                     logger.warning(f"UC08 limitation hit (parameterized): Monthly task for day {day} failed")
                     raise DatabaseError(
                         f"I'm sorry, but there's currently a known limitation with monthly tasks scheduled "
@@ -356,9 +516,36 @@ class DatabaseService:
                         f"3. Create separate tasks for different time periods\n\n"
                         f"Our team is working on a permanent solution. Thank you for your understanding.",
                         'UC08_MONTHLY_DAY_LIMITATION'
-                    )
+                    ) from e
             
-            raise DatabaseError(f"Parameterized task creation failed: {str(e)}", 'PARAMETERIZED_TASK_CREATION_FAILED')
+            raise DatabaseError(f"Parameterized task creation failed: {str(e)}", 'PARAMETERIZED_TASK_CREATION_FAILED') from e
+    
+    @staticmethod
+    def _store_translation_metadata(translation_metadata: Dict[str, Any], instance_id: int) -> None:
+        """
+        Store UC08 translation metadata linked to a created task. Best-effort:
+        the task already exists, so failures are logged and not raised.
+        
+        Args:
+            translation_metadata: Metadata from the UC08 translator
+            instance_id: Instance ID of the created task
+        """
+        try:
+            with DatabaseService.get_cursor(drain=True) as cursor:
+                cursor.execute(STORE_LINKED_TRANSLATION_METADATA, [
+                    translation_metadata['task_name'],
+                    translation_metadata['encoding_method'],
+                    translation_metadata['original_bitmask'],
+                    translation_metadata['encoded_value'],
+                    translation_metadata['day'],
+                    'Django UC08 Translator',
+                    f"Automatic translation for day {translation_metadata['day']}",
+                    instance_id,
+                ])
+                result = cursor.fetchone()
+            logger.info(f"UC08 Translation linked: metadata ID {result[0] if result else None} -> task ID {instance_id}")
+        except Exception as e:
+            logger.error(f"Failed to store UC08 metadata for task {instance_id}: {e}")
     
     @staticmethod
     def add_to_priority_list_workaround(instance_id: int, assignees_str: str) -> bool:
@@ -376,7 +563,7 @@ class DatabaseService:
         logger.info(f"UC03 Workaround called for instance {instance_id} with assignees: {assignees_str}")
         
         try:
-            with DatabaseService.get_cursor() as cursor:
+            with DatabaseService.get_cursor(fast_executemany=True) as cursor:
                 # Get the ActiveChecklistID
                 cursor.execute(GET_ACTIVE_CHECKLIST_ID, [instance_id])
                 active_result = cursor.fetchone()
@@ -387,29 +574,34 @@ class DatabaseService:
                 
                 active_checklist_id = active_result[0]
                 
-                if assignees_str:
-                    # Parse assignee names and get their user IDs
-                    assignee_names = [name.strip() for name in assignees_str.split(',')]
+                # Parse assignee names, skipping blanks left by stray or trailing commas
+                assignee_names = tuple(name.strip() for name in (assignees_str or '').split(',') if name.strip())
+                
+                if assignee_names:
+                    # Resolve all the assignees' users in one query
+                    placeholders = ", ".join(["%s"] * len(assignee_names))
+                    cursor.execute(GET_USERS_IN_GROUPS.format(placeholders=placeholders), assignee_names)
+                    user_rows = cursor.fetchall()
                     
-                    for assignee_name in assignee_names:
-                        # Get users from the group
-                        cursor.execute(GET_USERS_IN_GROUP, [assignee_name])
-                        user_ids = cursor.fetchall()
-                        
-                        if user_ids:
-                            for user_id_row in user_ids:
-                                user_id = user_id_row[0]
-                                # Add to priority list
-                                cursor.execute(ADD_TO_PRIORITY_LIST_PROCEDURE, [user_id, active_checklist_id])
-                                logger.debug(f"Added UserID {user_id} to priority list for task {instance_id}")
-                        else:
-                            # If no users in group, try to add a test user as fallback
-                            logger.warning(f"UC03 Workaround: No users found in group '{assignee_name}', trying fallback")
-                            cursor.execute(GET_TEST_USER)
-                            test_user = cursor.fetchone()
-                            if test_user:
-                                cursor.execute(ADD_TO_PRIORITY_LIST_PROCEDURE, [test_user[0], active_checklist_id])
-                                logger.info(f"UC03 Workaround: Added test user to priority list for validation")
+                    found_groups = {row[1].lower() for row in user_rows}
+                    user_ids = list(dict.fromkeys(row[0] for row in user_rows))
+                    missing_groups = [name for name in assignee_names if name.lower() not in found_groups]
+                    
+                    if missing_groups:
+                        # If a group has no users, add a test user as fallback
+                        logger.warning(f"UC03 Workaround: No users found in groups {missing_groups}, trying fallback")
+                        cursor.execute(GET_TEST_USER)
+                        test_user = cursor.fetchone()
+                        if test_user and test_user[0] not in user_ids:
+                            user_ids.append(test_user[0])
+                            logger.info(f"UC03 Workaround: Added test user to priority list for validation")
+                    
+                    if user_ids:
+                        cursor.executemany(
+                            ADD_TO_PRIORITY_LIST_PROCEDURE,
+                            [(user_id, active_checklist_id) for user_id in user_ids]
+                        )
+                        logger.debug(f"Added UserIDs {user_ids} to priority list for task {instance_id}")
                 
                 logger.info(f"UC03 Workaround: Completed for task {instance_id}")
                 return True
@@ -435,14 +627,10 @@ class DatabaseService:
         instance_id = None
         
         try:
-            # Try main stored procedure first
+            # The procedure call falls back to a lookup by task name when no
+            # instance ID is returned, so no second query is needed here
             instance_id = DatabaseService.create_task_via_stored_procedure(params)
             
-            # If that fails, try fallback by name lookup
-            if not instance_id:
-                logger.warning("No instance ID from stored procedure, searching by task name...")
-                instance_id = DatabaseService.find_task_by_name(params.get('TaskName', ''))
-            
             # Apply UC03 workaround if priority list is requested
             if instance_id and params.get('AddToPriorityList') == 1:
                 logger.info("Applying UC03 workaround for priority list")
@@ -464,6 +652,85 @@ class DatabaseService:
             # Re-raise the original exception
             raise
     
+    @staticmethod
+    def supports_bulk_creation(param_list: List[Any]) -> bool:
+        """
+        Check whether a task can go through create_tasks_bulk().
+        Tasks that need UC08 translation have to be created one at a time.
+        
+        Args:
+            param_list: List of parameters in stored procedure order
+            
+        Returns:
+            True if the task can be created in a bulk request
+        """
+        return not _translator.needs_translation(param_list[13], param_list[12])
+    
+    @staticmethod
+    def create_tasks_bulk(param_lists: List[List[Any]]) -> Tuple[List[Optional[int]], Optional[DatabaseError], bool]:
+        """
+        Create several tasks with one stored procedure batch per
+        _BULK_CREATE_MAX_TASKS tasks instead of one round-trip each, applying
+        the UC03 priority list workaround to the created tasks.
+        
+        The batch stops at the first task that fails. Tasks before it stay
+        created, so the returned list can be shorter than param_lists.
+        
+        Args:
+            param_lists: Parameter lists in stored procedure order; none of them
+                may need UC08 translation (see supports_bulk_creation)
+            
+        Returns:
+            Tuple of (instance IDs, error, retry_safe). The IDs (None where no ID
+            was returned) cover the leading tasks the server confirmed, in the
+            same order as param_lists. error is set when the server rejected the
+            next task; that task may be partly created and must not be retried.
+            retry_safe is True when the tasks after those are known not to have
+            run, so the caller can create them individually; False when the
+            outcome is unknown, e.g. the results could not be read.
+        """
+        instance_ids = []
+        bulk_error = None
+        retry_safe = True
+        
+        try:
+            with DatabaseService.get_cursor(drain=True) as cursor:
+                for start in range(0, len(param_lists), _BULK_CREATE_MAX_TASKS):
+                    chunk = param_lists[start:start + _BULK_CREATE_MAX_TASKS]
+                    query = CREATE_TASK_BULK_HEADER + CREATE_TASK_BULK_ROW * len(chunk)
+                    # From here until every result is read, a failure leaves
+                    # the remaining tasks in an unknown state
+                    retry_safe = False
+                    cursor.execute(query, [param for param_list in chunk for param in param_list])
+                    
+                    # One single-row result set per task, in submission order
+                    for i in range(len(chunk)):
+                        if i:
+                            cursor.nextset()
+                        instance_id, error_message = cursor.fetchone()
+                        if error_message is not None:
+                            # The server ended the batch at this task
+                            logger.error(f"Bulk task creation failed at task {start + i + 1}: {error_message}")
+                            bulk_error = DatabaseError(f"Task creation failed: {error_message}", 'TASK_CREATION_FAILED')
+                            break
+                        instance_ids.append(instance_id)
+                    retry_safe = True
+                    if len(instance_ids) < start + len(chunk):
+                        break
+        except Exception as e:
+            error_handler.log_error(e, {'operation': 'create_tasks_bulk', 'created': len(instance_ids)})
+            logger.error(f"Bulk task creation stopped after {len(instance_ids)} of {len(param_lists)} tasks: {e}")
+        
+        logger.info(f"Bulk task creation returned {len(instance_ids)} instance IDs for {len(param_lists)} tasks")
+        
+        # Apply UC03 workaround to created tasks that requested the priority list
+        for param_list, instance_id in zip(param_lists, instance_ids):
+            if instance_id and param_list[19] == 1:
+                logger.info("Applying UC03 workaround for priority list")
+                error_handler.apply_uc03_priority_list_workaround(instance_id, param_list[3])
+        
+        return instance_ids, bulk_error, retry_safe
+    
     @staticmethod
     def call_stored_procedure(procedure_name: str, params: List[Any]) -> List[Any]:
         """
@@ -477,7 +744,7 @@ class DatabaseService:
             Results from the stored procedure
         """
         try:
-            with DatabaseService.get_cursor() as cursor:
+            with DatabaseService.get_cursor(drain=True) as cursor:
                 cursor.callproc(procedure_name, params)
                 result = cursor.fetchall()
                 return result
@@ -6,13 +6,227 @@ including timezone handling, natural language date/time parsing, and smart defau
 """
 
 import datetime
+import functools
 import pytz
 import re
 import logging
+import time
 from dateutil.relativedelta import relativedelta
 
 logger = logging.getLogger(__name__)
 
+# How long a computed "today" is reused per timezone (never past local midnight)
+_TODAY_CACHE_SECONDS = 60
+# {timezone name: (monotonic expiry, date)}
+_today_cache = {}
+
+# 12-hour clock times such as "2pm", "12:30am", "3:45 pm"
+_AM_PM_RE = re.compile(r'(\d{1,2})(?::(\d{2}))?\s*(am|pm)')
+# Same ASCII forms datetime.strptime accepts for '%H:%M' and '%Y-%m-%d'
+_HHMM_RE = re.compile(r'(?:2[0-3]|[01]?\d):(?:[0-5]?\d)', re.ASCII)
+_YMD_RE = re.compile(r'(\d{4})-(\d{1,2})-(\d{1,2}| [1-9])', re.ASCII)
+
+
+_ONE_DAY = datetime.timedelta(days=1)
+_ONE_WEEK = datetime.timedelta(weeks=1)
+_ONE_MONTH = relativedelta(months=+1)
+# timedelta(days=n) for every weekday distance n in 0..7
+_DAY_OFFSETS = tuple(datetime.timedelta(days=n) for n in range(8))
+
+# Exact relative-day phrases and their offset from today
+_RELATIVE_DAY_OFFSETS = {
+    'today': _DAY_OFFSETS[0],
+    'tomorrow': _ONE_DAY,
+    'tmrw': _ONE_DAY,
+    'day after tomorrow': _DAY_OFFSETS[2],
+    'day after tmrw': _DAY_OFFSETS[2],
+    'yesterday': -_ONE_DAY,
+}
+
+# Exact time-of-day phrases and the HH:MM they resolve to
+_NATURAL_TIMES = {
+    'morning': '09:00',
+    'early morning': '09:00',
+    'late morning': '11:00',
+    'noon': '12:00',
+    'midday': '12:00',
+    'afternoon': '14:00',
+    'early afternoon': '14:00',
+    'late afternoon': '16:00',
+    'evening': '18:00',
+    'early evening': '18:00',
+    'late evening': '20:00',
+    'night': '22:00',
+    'late night': '22:00',
+    'midnight': '00:00',
+    'after close': '19:00',  # 7 PM after close
+    'after closing': '19:00',
+    'before close': '16:00',
+    'before closing': '16:00',
+}
+
+_WEEKDAYS = ('monday', 'tuesday', 'wednesday', 'thursday', 'friday', 'saturday', 'sunday')
+
+# Exact "next <weekday>" / "this <weekday>" phrases -> (is_next, weekday index)
+_WEEKDAY_PHRASES = {
+    f'{qualifier} {day_name}': (qualifier == 'next', i)
+    for qualifier in ('next', 'this')
+    for i, day_name in enumerate(_WEEKDAYS)
+}
+
+
+# Whole words in a task name that make it due today instead of tomorrow
+_URGENT_WORDS = frozenset({'urgent', 'asap', 'immediately', 'now'})
+_WORD_RE = re.compile(r'\w+')
+
+# Due time used when the task name gives no hint (7 PM, per requirement)
+_DEFAULT_DUE_TIME = '19:00'
+
+# Task-name keywords that imply a default due time, in priority order
+_TASK_TIME_KEYWORDS = (
+    (('meeting', 'standup', 'sync', 'huddle', 'call'), '14:00'),  # 2 PM for meetings
+    (('check email', 'daily check', 'morning'), '09:00'),  # 9 AM for morning tasks
+    (('report', 'review', 'analysis', 'summary'), '19:00'),  # 7 PM for reports
+    (('remind',), '10:00'),  # 10 AM for reminders
+    (('end of day', 'eod', 'close'), '19:00'),  # 7 PM for end of day tasks
+)
+# {keyword: (priority rank, due time)}
+_TASK_KEYWORD_TIMES = {
+    keyword: (rank, due_time)
+    for rank, (keywords, due_time) in enumerate(_TASK_TIME_KEYWORDS)
+    for keyword in keywords
+}
+# Lookahead so findall reports every keyword occurrence, including overlapping ones
+_TASK_KEYWORD_RE = re.compile(
+    '(?=(' + '|'.join(re.escape(keyword) for keyword in _TASK_KEYWORD_TIMES) + '))'
+)
+
+
+_WEEKDAY_PHRASE_RE = re.compile(r'(next|this) (' + '|'.join(_WEEKDAYS) + ')')
+_WEEKDAY_INDEX = {day_name: i for i, day_name in enumerate(_WEEKDAYS)}
+
+
+def _find_weekday_phrase(text):
+    """
+    Find a "next <weekday>" / "this <weekday>" phrase anywhere in text.
+    "next" phrases win over "this", then the earliest weekday in the week.
+    
+    Returns:
+        tuple|None: (is_next, weekday index) or None if no phrase is present
+    """
+    best = min(
+        ((qualifier != 'next', _WEEKDAY_INDEX[day_name]) for qualifier, day_name in _WEEKDAY_PHRASE_RE.findall(text)),
+        default=None
+    )
+    if best is None:
+        return None
+    return not best[0], best[1]
+
+
+def _weekday_date(today, target_weekday, is_next):
+    """
+    Return the date of the given weekday relative to today.
+    "this <day>" includes today; "next <day>" moves a week ahead when today matches.
+    """
+    days_ahead = (target_weekday - today.weekday()) % 7
+    if is_next and days_ahead == 0:
+        days_ahead = 7
+    return today + _DAY_OFFSETS[days_ahead]
+
+
+def _end_of_week(today):
+    """Return Friday of this week, or of next week if today is Friday (matches validator logic)."""
+    days_until_friday = (4 - today.weekday()) % 7
+    if days_until_friday == 0:
+        days_until_friday = 7
+    return today + _DAY_OFFSETS[days_until_friday]
+
+
+def _start_of_next_month(today):
+    """Return the first day of the month after today's."""
+    return today.replace(day=1) + _ONE_MONTH
+
+
+def _start_of_week(today):
+    """Return the Monday of today's week."""
+    return today - _DAY_OFFSETS[today.weekday()]
+
+
+def _start_of_month(today):
+    """Return the first day of today's month."""
+    return today.replace(day=1)
+
+
+# Leading phrases and the date each resolves to, checked in order
+_DATE_PREFIX_HANDLERS = (
+    ('next week', lambda today: today + _ONE_WEEK),
+    ('next month', _start_of_next_month),
+    ('this week', _start_of_week),
+    ('this month', _start_of_month),
+)
+
+
+def _parse_ymd(value):
+    """Parse a 'YYYY-MM-DD' string, using the C ISO parser for the canonical zero-padded form."""
+    if len(value) == 10 and value[4] == '-' and value[7] == '-' and value[5:7].isdigit():
+        try:
+            return datetime.date.fromisoformat(value)
+        except ValueError:
+            pass
+    return datetime.datetime.strptime(value, '%Y-%m-%d').date()
+
+
+def _parse_hhmm(value):
+    """Parse an 'HH:MM' string, using the C ISO parser for the canonical zero-padded form."""
+    if len(value) == 5 and value[2] == ':':
+        try:
+            return datetime.time.fromisoformat(value)
+        except ValueError:
+            pass
+    return datetime.datetime.strptime(value, '%H:%M').time()
+
+
+def _is_hhmm(value):
+    """Return True if value is a valid 'HH:MM' time string."""
+    return _HHMM_RE.fullmatch(value) is not None
+
+
+def _is_ymd(value):
+    """Return True if value is a valid 'YYYY-MM-DD' calendar date string."""
+    # Fast path: canonical zero-padded dates are validated by the C parser
+    if len(value) == 10 and value[4] == '-' and value[7] == '-' and value[5:7].isdigit():
+        try:
+            datetime.date.fromisoformat(value)
+            return True
+        except ValueError:
+            pass
+    
+    match = _YMD_RE.fullmatch(value)
+    if not match:
+        return False
+    try:
+        datetime.date(*map(int, match.groups()))
+        return True
+    except ValueError:
+        return False
+
+
+@functools.lru_cache(maxsize=512)
+def _get_timezone(name):
+    """
+    Return the timezone for name, memoized per zone name.
+    
+    Zones with a single fixed offset (UTC, Etc/GMT+5, ...) come back as a
+    datetime.timezone, which needs no pytz localize(); every other zone is
+    the pytz timezone.
+    """
+    tz = pytz.timezone(name)
+    if tz is pytz.utc:
+        return datetime.timezone.utc
+    if isinstance(tz, pytz.tzinfo.StaticTzInfo):
+        return datetime.timezone(tz.utcoffset(None), name)
+    return tz
+
 
 class DateTimeService:
     """
@@ -42,12 +256,12 @@ class DateTimeService:
                 
             # Parse the date and time
             if isinstance(date_str, str):
-                date_obj = datetime.datetime.strptime(date_str, '%Y-%m-%d').date()
+                date_obj = _parse_ymd(date_str)
             else:
                 date_obj = date_str
                 
             if isinstance(time_str, str):
-                time_obj = datetime.datetime.strptime(time_str, '%H:%M').time()
+                time_obj = _parse_hhmm(time_str)
             else:
                 time_obj = time_str
                 
@@ -55,12 +269,22 @@ class DateTimeService:
             datetime_obj = datetime.datetime.combine(date_obj, time_obj)
             
             # Convert to user timezone
-            user_tz = pytz.timezone(user_timezone)
-            local_dt = user_tz.localize(datetime_obj)
+            user_tz = _get_timezone(user_timezone)
+            if isinstance(user_tz, datetime.timezone):
+                # Fixed offset: no DST gaps or overlaps to resolve
+                local_dt = datetime_obj.replace(tzinfo=user_tz)
+                return local_dt.date().isoformat(), f"{local_dt.hour:02d}:{local_dt.minute:02d}"
+            try:
+                # is_dst=None makes DST gaps/overlaps raise instead of being guessed silently
+                local_dt = user_tz.localize(datetime_obj, is_dst=None)
+            except (pytz.exceptions.AmbiguousTimeError, pytz.exceptions.NonExistentTimeError) as e:
+                logger.warning("%s is ambiguous or skipped in %s (%s); using standard time",
+                               datetime_obj, user_timezone, type(e).__name__)
+                local_dt = user_tz.localize(datetime_obj)
             
-            return local_dt.date().isoformat(), local_dt.time().strftime('%H:%M')
+            return local_dt.date().isoformat(), f"{local_dt.hour:02d}:{local_dt.minute:02d}"
         except Exception as e:
-            logger.warning(f"Failed to convert to user timezone: {e}")
+            logger.warning("Failed to convert to user timezone: %s", e)
             # If conversion fails, return original values
             return date_str, time_str
 
@@ -78,12 +302,22 @@ class DateTimeService:
         Raises:
             None: Returns UTC date if timezone is invalid
         """
+        cached = _today_cache.get(user_timezone)
+        now_ts = time.monotonic()
+        if cached and cached[0] > now_ts:
+            return cached[1]
+        
         try:
-            user_tz = pytz.timezone(user_timezone)
+            user_tz = _get_timezone(user_timezone)
             current_time = datetime.datetime.now(user_tz)
-            return current_time.date()
+            today = current_time.date()
+            
+            # Expire at local midnight at the latest so the date never goes stale
+            seconds_to_midnight = 86400 - (current_time.hour * 3600 + current_time.minute * 60 + current_time.second)
+            _today_cache[user_timezone] = (now_ts + min(_TODAY_CACHE_SECONDS, seconds_to_midnight), today)
+            return today
         except Exception as e:
-            logger.warning(f"Invalid timezone '{user_timezone}': {e}")
+            logger.warning("Invalid timezone '%s': %s", user_timezone, e)
             # Fallback to UTC if timezone is invalid
             return datetime.date.today()
 
@@ -99,93 +333,65 @@ class DateTimeService:
         Returns:
             str|None: ISO format date string (YYYY-MM-DD) or None if parsing fails
         """
-        # Get current date in user's timezone
-        today = cls.get_current_date_in_timezone(user_timezone)
-        
         if not date_str:
             return None
         
+        # Resolve relative to the current date in the user's timezone
+        return cls._parse_natural_date_core(date_str, cls.get_current_date_in_timezone(user_timezone))
+
+    @staticmethod
+    def _parse_natural_date_core(date_str, today):
+        """
+        Parse a natural language date relative to the given date.
+        Shared by parse_natural_date_with_timezone and parse_natural_date.
+        
+        Args:
+            date_str (str): Non-empty natural language date string
+            today (date): Date that relative phrases are resolved against
+            
+        Returns:
+            str|None: ISO format date string (YYYY-MM-DD) or None if parsing fails
+        """
         s = date_str.strip().lower()
         
         # Handle relative dates
-        if s == 'today':
-            return today.isoformat()
-        elif s == 'tomorrow' or s == 'tmrw':
-            return (today + datetime.timedelta(days=1)).isoformat()
-        elif s == 'day after tomorrow' or s == 'day after tmrw':
-            return (today + datetime.timedelta(days=2)).isoformat()
-        elif s == 'yesterday':
-            return (today - datetime.timedelta(days=1)).isoformat()
-        
-        # Handle "next [weekday]" patterns - FIXED!
-        weekdays = ['monday', 'tuesday', 'wednesday', 'thursday', 'friday', 'saturday', 'sunday']
-        for i, day_name in enumerate(weekdays):
-            if f'next {day_name}' in s:
-                current_weekday = today.weekday()
-                target_weekday = i
-                days_ahead = (target_weekday - current_weekday) % 7
-                if days_ahead == 0:
-                    days_ahead = 7  # If today is the target day, go to next week
-                target_date = today + datetime.timedelta(days=days_ahead)
-                logger.debug(f"Parsed 'next {day_name}' as {target_date.isoformat()}")
-                return target_date.isoformat()
-        
-        # Handle "this [weekday]" patterns
-        for i, day_name in enumerate(weekdays):
-            if f'this {day_name}' in s:
-                current_weekday = today.weekday()
-                target_weekday = i
-                days_ahead = (target_weekday - current_weekday) % 7
-                # For "this", include today if it matches
-                target_date = today + datetime.timedelta(days=days_ahead)
-                logger.debug(f"Parsed 'this {day_name}' as {target_date.isoformat()}")
-                return target_date.isoformat()
+        offset = _RELATIVE_DAY_OFFSETS.get(s)
+        if offset is not None:
+            return (today + offset).isoformat()
+        
+        # Exact "next/this [weekday]"
+        weekday_phrase = _WEEKDAY_PHRASES.get(s)
+        if weekday_phrase is not None:
+            return _weekday_date(today, weekday_phrase[1], weekday_phrase[0]).isoformat()
+        
+        # Handle "next/this [weekday]" patterns embedded in longer text - FIXED!
+        weekday_phrase = _find_weekday_phrase(s)
+        if weekday_phrase is not None:
+            # For "this", include today if it matches
+            target_iso = _weekday_date(today, weekday_phrase[1], weekday_phrase[0]).isoformat()
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("Parsed weekday phrase in '%s' as %s", s, target_iso)
+            return target_iso
         
         # Handle end of week/month
         if 'end of week' in s or 'end of the week' in s:
-            # Go to Friday - matching validator logic
-            days_until_friday = (4 - today.weekday()) % 7
-            if days_until_friday == 0:
-                days_until_friday = 7  # If today is Friday, go to next Friday
-            return (today + datetime.timedelta(days=days_until_friday)).isoformat()
+            return _end_of_week(today).isoformat()
         
-        elif s.startswith('next week'):
-            return (today + datetime.timedelta(weeks=1)).isoformat()
-        elif s.startswith('next month'):
-            # Add one month to current date
-            next_month = today.replace(day=1) + datetime.timedelta(days=32)
-            next_month = next_month.replace(day=1)
-            return next_month.isoformat()
-        elif s.startswith('this week'):
-            # Find the start of current week (Monday)
-            days_since_monday = today.weekday()
-            monday = today - datetime.timedelta(days=days_since_monday)
-            return monday.isoformat()
-        elif s.startswith('this month'):
-            # First day of current month
-            first_day = today.replace(day=1)
-            return first_day.isoformat()
-        elif s.startswith('in ') and ' days' in s:
-            # Handle "in X days"
-            try:
-                days = int(s.split('in ')[1].split(' days')[0])
-                return (today + datetime.timedelta(days=days)).isoformat()
-            except:
-                pass
-        elif s.startswith('in ') and ' day' in s:
-            # Handle "in X day" (singular)
+        for prefix, resolve in _DATE_PREFIX_HANDLERS:
+            if s.startswith(prefix):
+                return resolve(today).isoformat()
+        
+        if s.startswith('in ') and ' day' in s:
+            # Handle "in X days" / "in X day"
+            unit = ' days' if ' days' in s else ' day'
             try:
-                days = int(s.split('in ')[1].split(' day')[0])
+                days = int(s.split('in ')[1].split(unit)[0])
                 return (today + datetime.timedelta(days=days)).isoformat()
-            except:
+            except ValueError:
                 pass
         
         # If already in YYYY-MM-DD format, return as is
-        try:
-            datetime.datetime.strptime(date_str, '%Y-%m-%d')
-            return date_str
-        except Exception:
-            return None
+        return date_str if _is_ymd(date_str) else None
 
     @staticmethod
     def parse_natural_time_with_timezone(time_str, user_timezone):
@@ -205,31 +411,12 @@ class DateTimeService:
         s = time_str.strip().lower()
         
         # Handle common time references
-        if s == 'morning' or s == 'early morning':
-            return '09:00'
-        elif s == 'late morning':
-            return '11:00'
-        elif s == 'noon' or s == 'midday':
-            return '12:00'
-        elif s == 'afternoon' or s == 'early afternoon':
-            return '14:00'
-        elif s == 'late afternoon':
-            return '16:00'
-        elif s == 'evening' or s == 'early evening':
-            return '18:00'
-        elif s == 'late evening':
-            return '20:00'
-        elif s == 'night' or s == 'late night':
-            return '22:00'
-        elif s == 'midnight':
-            return '00:00'
-        elif s == 'after close' or s == 'after closing':
-            return '19:00'  # 7 PM after close
-        elif s == 'before close' or s == 'before closing':
-            return '16:00'
+        natural_time = _NATURAL_TIMES.get(s)
+        if natural_time is not None:
+            return natural_time
         
         # Handle AM/PM format (e.g., "2pm", "12:30am", "3:45 PM")
-        am_pm_match = re.match(r'(\d{1,2})(?::(\d{2}))?\s*(am|pm)', s)
+        am_pm_match = _AM_PM_RE.match(s)
         if am_pm_match:
             hour = int(am_pm_match.group(1))
             minute = int(am_pm_match.group(2) or 0)
@@ -244,11 +431,7 @@ class DateTimeService:
             return f"{hour:02d}:{minute:02d}"
         
         # If already in HH:MM format, return as is
-        try:
-            datetime.datetime.strptime(time_str, '%H:%M')
-            return time_str
-        except Exception:
-            return None
+        return time_str if _is_hhmm(time_str) else None
 
     @staticmethod
     def parse_natural_date(date_str):
@@ -261,47 +444,9 @@ class DateTimeService:
         Returns:
             str|None: ISO format date string (YYYY-MM-DD) or None if parsing fails
         """
-        today = datetime.date.today()
         if not date_str:
             return None
-        s = date_str.strip().lower()
-        if s == 'today':
-            return today.isoformat()
-        if s == 'tomorrow' or s == 'tmrw':
-            return (today + datetime.timedelta(days=1)).isoformat()
-        if s == 'day after tomorrow':
-            return (today + datetime.timedelta(days=2)).isoformat()
-        if s == 'yesterday':
-            return (today - datetime.timedelta(days=1)).isoformat()
-        
-        # Handle "next [weekday]" patterns
-        weekdays = ['monday', 'tuesday', 'wednesday', 'thursday', 'friday', 'saturday', 'sunday']
-        for i, day_name in enumerate(weekdays):
-            if f'next {day_name}' in s:
-                current_weekday = today.weekday()
-                target_weekday = i
-                days_ahead = (target_weekday - current_weekday) % 7
-                if days_ahead == 0:
-                    days_ahead = 7  # If today is the target day, go to next week
-                return (today + datetime.timedelta(days=days_ahead)).isoformat()
-        
-        # Handle "this [weekday]" patterns
-        for i, day_name in enumerate(weekdays):
-            if f'this {day_name}' in s:
-                current_weekday = today.weekday()
-                target_weekday = i
-                days_ahead = (target_weekday - current_weekday) % 7
-                return (today + datetime.timedelta(days=days_ahead)).isoformat()
-        
-        if s.startswith('next week'):
-            return (today + datetime.timedelta(weeks=1)).isoformat()
-        # Add more patterns as needed
-        # If already in YYYY-MM-DD, return as is
-        try:
-            datetime.datetime.strptime(date_str, '%Y-%m-%d')
-            return date_str
-        except Exception:
-            return None
+        return DateTimeService._parse_natural_date_core(date_str, datetime.date.today())
 
     @staticmethod
     def parse_natural_time(time_str):
@@ -324,11 +469,7 @@ class DateTimeService:
         if s == 'evening':
             return '19:00'
         # If already in HH:MM format, return as is
-        try:
-            datetime.datetime.strptime(time_str, '%H:%M')
-            return time_str
-        except Exception:
-            return None
+        return time_str if _is_hhmm(time_str) else None
 
     @staticmethod
     def guess_time_from_task_type(task_name):
@@ -341,31 +482,30 @@ class DateTimeService:
         Returns:
             str: Time in HH:MM format based on task type patterns
         """
-        task_lower = task_name.lower()
+        if not task_name:
+            return _DEFAULT_DUE_TIME
         
-        # Meeting patterns
-        if any(word in task_lower for word in ['meeting', 'standup', 'sync', 'huddle', 'call']):
-            return '14:00'  # 2 PM for meetings
+        # One scan for all keywords; the highest-priority group found wins
+        matches = [_TASK_KEYWORD_TIMES[keyword] for keyword in _TASK_KEYWORD_RE.findall(task_name.lower())]
+        if matches:
+            return min(matches)[1]
         
-        # Morning tasks
-        elif any(word in task_lower for word in ['check email', 'daily check', 'morning']):
-            return '09:00'  # 9 AM for morning tasks
-        
-        # Reports/reviews
-        elif any(word in task_lower for word in ['report', 'review', 'analysis', 'summary']):
-            return '19:00'  # 7 PM for reports
-        
-        # Reminders
-        elif 'remind' in task_lower:
-            return '10:00'  # 10 AM for reminders
-        
-        # End of day tasks
-        elif any(word in task_lower for word in ['end of day', 'eod', 'close']):
-            return '19:00'  # 7 PM default
+        return _DEFAULT_DUE_TIME
+
+    @staticmethod
+    @functools.lru_cache(maxsize=2048)
+    def _task_name_defaults(task_name):
+        """
+        Derive the name-based defaults for a task, memoized per task name.
         
-        # Default
-        else:
-            return '19:00'  # 7 PM default - per requirement
+        Args:
+            task_name (str): Name of the task
+            
+        Returns:
+            tuple: (is_urgent, due_time) where due_time is in HH:MM format
+        """
+        task_words = _WORD_RE.findall(task_name.lower()) if task_name else ()
+        return not _URGENT_WORDS.isdisjoint(task_words), DateTimeService.guess_time_from_task_type(task_name)
 
     @classmethod
     def set_default_due_date_time(cls, params, user_timezone):
@@ -382,21 +522,20 @@ class DateTimeService:
             dict: Modified parameters with default due date and time set
         """
         current_date = cls.get_current_date_in_timezone(user_timezone)
-        tomorrow = current_date + datetime.timedelta(days=1)
+        tomorrow = current_date + _ONE_DAY
+        is_urgent, due_time = cls._task_name_defaults(params.get('TaskName', ''))
         
         # Set default due date if not provided
         if not params.get('DueDate') or params['DueDate'] in [None, '']:
             # Check for urgency indicators
-            task_name = params.get('TaskName', '').lower()
-            if any(word in task_name for word in ['urgent', 'asap', 'immediately', 'now']):
+            if is_urgent:
                 params['DueDate'] = current_date.isoformat()  # Today for urgent tasks
             else:
                 params['DueDate'] = tomorrow.isoformat()  # Tomorrow by default
         
         # Set default due time if not provided - use smart defaults
         if not params.get('DueTime') or params['DueTime'] in [None, '']:
-            task_name = params.get('TaskName', '')
-            params['DueTime'] = cls.guess_time_from_task_type(task_name)
+            params['DueTime'] = due_time
         
         # Always set LocalDueDate to match the DueDate
         params['LocalDueDate'] = params['DueDate']
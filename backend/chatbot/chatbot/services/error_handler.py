@@ -5,15 +5,34 @@ This module provides centralized error handling and workarounds for the chatbot
 consolidating retry logic, custom exceptions, workarounds, and user-friendly error formatting.
 """
 
+import os
+import re
+import sys
 import time
+import queue
+import atexit
+import threading
 import logging
+import logging.handlers
 import functools
+import itertools
+import collections
+import dataclasses
 import traceback
+import types
 from typing import Dict, Any, List, Optional, Callable, Tuple
-from contextlib import contextmanager
+
+from ..config.settings import API_SETTINGS
 
 logger = logging.getLogger(__name__)
 
+# Attach the full error_context dict (incl. traceback) to tracked error records
+_STRUCTURED_LOGS = API_SETTINGS['LOG_STRUCTURED_ERRORS']
+
+# How long UC17 skips its stored procedure retry after that retry also hit the
+# missing view, so creating vwHolidaySchedule takes effect without a restart
+_UC17_RETRY_SKIP_SECONDS = API_SETTINGS['CACHE_TTL_SECONDS']
+
 
 # ============================================================================
 # CUSTOM EXCEPTIONS
@@ -22,6 +41,8 @@ logger = logging.getLogger(__name__)
 class BaseServiceError(Exception):
     """Base exception for all service errors."""
     
+    __slots__ = ('message', 'error_code', 'details', 'timestamp')
+    
     def __init__(self, message: str, error_code: str = None, details: Dict[str, Any] = None):
         """
         Initialize base service error.
@@ -41,6 +62,8 @@ class BaseServiceError(Exception):
 class TaskCreationError(BaseServiceError):
     """Exception raised when task creation fails."""
     
+    __slots__ = ()
+    
     def __init__(self, message: str, error_code: str = 'TASK_CREATION_FAILED', details: Dict[str, Any] = None):
         super().__init__(message, error_code, details)
 
@@ -48,6 +71,8 @@ class TaskCreationError(BaseServiceError):
 class ValidationError(BaseServiceError):
     """Exception raised when validation fails."""
     
+    __slots__ = ()
+    
     def __init__(self, message: str, error_code: str = 'VALIDATION_FAILED', details: Dict[str, Any] = None):
         super().__init__(message, error_code, details)
 
@@ -55,6 +80,8 @@ class ValidationError(BaseServiceError):
 class DatabaseError(BaseServiceError):
     """Exception raised when database operations fail."""
     
+    __slots__ = ()
+    
     def __init__(self, message: str, error_code: str = 'DATABASE_ERROR', details: Dict[str, Any] = None):
         super().__init__(message, error_code, details)
 
@@ -62,6 +89,8 @@ class DatabaseError(BaseServiceError):
 class AIServiceError(BaseServiceError):
     """Exception raised when AI service operations fail."""
     
+    __slots__ = ()
+    
     def __init__(self, message: str, error_code: str = 'AI_SERVICE_ERROR', details: Dict[str, Any] = None):
         super().__init__(message, error_code, details)
 
@@ -70,6 +99,57 @@ class AIServiceError(BaseServiceError):
 # RETRY DECORATORS
 # ============================================================================
 
+class _RetryWrapper:
+    """
+    Callable produced by retry_with_backoff.
+    
+    Holding the retry settings as attributes keeps the no-failure path to a
+    single try/call; the attempt loop only runs once the first call raises.
+    """
+    
+    __slots__ = ('func', 'max_retries', 'delays', 'exceptions', '__dict__')
+    
+    def __init__(self, func: Callable, max_retries: int, delays: Tuple[float, ...],
+                 exceptions: Tuple):
+        self.func = func
+        self.max_retries = max_retries
+        self.delays = delays
+        self.exceptions = exceptions
+        functools.update_wrapper(self, func)
+    
+    def __get__(self, instance, owner=None):
+        # Bind like a plain function so decorated methods still receive self
+        if instance is None:
+            return self
+        return types.MethodType(self, instance)
+    
+    def __call__(self, *args, **kwargs):
+        try:
+            return self.func(*args, **kwargs)
+        except self.exceptions as e:
+            error = e
+        # Retry outside the except block, so later failures aren't chained to this one
+        return self._retry(error, args, kwargs)
+    
+    def _retry(self, error: Exception, args, kwargs):
+        """Run the remaining attempts after the first call raised error."""
+        func = self.func
+        max_retries = self.max_retries
+        
+        for attempt, delay in enumerate(self.delays):
+            logger.warning("Function %s failed (attempt %d/%d), retrying in %.2f seconds: %s",
+                           func.__name__, attempt + 1, max_retries + 1, delay, error)
+            time.sleep(delay)
+            try:
+                return func(*args, **kwargs)
+            except self.exceptions as e:
+                error = e
+        
+        logger.error("Function %s failed after %d retries: %s",
+                     func.__name__, max_retries, error)
+        raise error
+
+
 def retry_with_backoff(max_retries: int = 3, base_delay: float = 1.0, 
                        backoff_multiplier: float = 2.0, 
                        exceptions: Tuple = (Exception,)):
@@ -85,30 +165,12 @@ def retry_with_backoff(max_retries: int = 3, base_delay: float = 1.0,
     Returns:
         Decorated function with retry logic
     """
+    # Sleep before retry n is fixed by the decorator arguments, so compute the
+    # whole schedule once instead of a float pow per failed attempt
+    delays = tuple(base_delay * (backoff_multiplier ** i) for i in range(max_retries))
+    
     def decorator(func: Callable):
-        @functools.wraps(func)
-        def wrapper(*args, **kwargs):
-            last_exception = None
-            
-            for attempt in range(max_retries + 1):
-                try:
-                    return func(*args, **kwargs)
-                except exceptions as e:
-                    last_exception = e
-                    
-                    if attempt == max_retries:
-                        logger.error(f"Function {func.__name__} failed after {max_retries} retries: {e}")
-                        raise
-                    
-                    delay = base_delay * (backoff_multiplier ** attempt)
-                    logger.warning(f"Function {func.__name__} failed (attempt {attempt + 1}/{max_retries + 1}), "
-                                 f"retrying in {delay:.2f} seconds: {e}")
-                    time.sleep(delay)
-            
-            # This should never be reached, but just in case
-            raise last_exception
-            
-        return wrapper
+        return _RetryWrapper(func, max_retries, delays, exceptions)
     return decorator
 
 
@@ -142,10 +204,203 @@ def retry_ai_service_call(max_retries: int = 2):
     )
 
 
+# ============================================================================
+# USER-FACING ERROR MESSAGES
+# ============================================================================
+
+_DB_USER_NOT_CONFIGURED_MSG = (
+    "I'm sorry, but I couldn't create the task because the user account "
+    "'{user_fullname}' isn't fully configured in the system. "
+    "Please try one of these options:\n\n"
+    "• Use a different user account\n"
+    "• Specify who should be assigned the task (e.g., 'assign to John Smith')\n"
+    "• Contact your administrator to complete the setup for '{user_fullname}'"
+)
+_DB_DUPLICATE_TASK_MSG = (
+    "A task named '{task_name}' already exists. "
+    "Please try:\n\n"
+    "• Using a different task name\n"
+    "• Adding more details to make it unique (e.g., 'follow up email - client ABC')\n"
+    "• Including a date or project name"
+)
+_DB_CONNECTION_MSG = ("I'm having trouble connecting to the database right now. "
+                      "Please try again in a moment.")
+_DB_GENERIC_MSG = ("There was a problem with the database operation. "
+                   "Please try again or contact support if the issue persists.")
+
+_AI_TIMEOUT_MSG = ("The AI service is taking longer than usual to respond. "
+                   "Please try again with a simpler request.")
+_AI_RATE_LIMIT_MSG = ("I'm receiving too many requests right now. "
+                      "Please wait a moment and try again.")
+_AI_MALFORMED_MSG = ("I had trouble understanding your request. "
+                     "Could you please rephrase it more clearly?")
+_AI_GENERIC_MSG = ("I'm having trouble processing your request right now. "
+                   "Please try again in a moment.")
+
+# View whose absence from the database triggers the UC17 workaround
+_UC17_MISSING_VIEW = 'vwHolidaySchedule'
+
+# Error-text classifiers. Each alternative is an empty named group behind a
+# lookahead over the whole message, tried in order from the start, so one
+# match() picks the highest-priority pattern and lastgroup names it.
+_SERVICE_KEYWORD_RE = re.compile(
+    r"(?=.*database)(?P<database>)"
+    r"|(?=.*groq)(?P<groq>)",
+    re.IGNORECASE | re.DOTALL
+)
+_DB_ERROR_RE = re.compile(
+    r"(?=.*'ManagerGroupID')(?=.*NULL)(?P<manager_group>)"
+    r"|(?=.*Task with the provided name already exists)(?P<duplicate>)"
+    r"|(?=.*(?i:connection|timeout))(?P<connection>)",
+    re.DOTALL
+)
+_AI_ERROR_RE = re.compile(
+    r"(?=.*timeout)(?P<timeout>)"
+    r"|(?=.*rate limit)(?P<rate_limit>)"
+    r"|(?=.*(?:invalid|malformed))(?P<malformed>)",
+    re.IGNORECASE | re.DOTALL
+)
+
+
+@functools.lru_cache(maxsize=256)
+def _format_database_error_text(error_str: str, user_fullname: str, task_name: str) -> str:
+    """
+    Map database error text to its user-facing message.
+    
+    Memoized because a misconfigured account or a repeated task name tends to
+    produce the same error over and over.
+    """
+    match = _DB_ERROR_RE.match(error_str)
+    kind = match.lastgroup if match else None
+    
+    # Handle specific database error patterns
+    if kind == 'manager_group':
+        return _DB_USER_NOT_CONFIGURED_MSG.format(user_fullname=user_fullname)
+    
+    elif kind == 'duplicate':
+        return _DB_DUPLICATE_TASK_MSG.format(task_name=task_name)
+    
+    elif kind == 'connection':
+        return _DB_CONNECTION_MSG
+    
+    else:
+        return _DB_GENERIC_MSG
+
+
+@functools.lru_cache(maxsize=256)
+def _format_ai_service_error_text(error_str: str) -> str:
+    """Map AI service error text to its user-facing message, memoized per error text."""
+    match = _AI_ERROR_RE.match(error_str)
+    kind = match.lastgroup if match else None
+    
+    if kind == 'timeout':
+        return _AI_TIMEOUT_MSG
+    
+    elif kind == 'rate_limit':
+        return _AI_RATE_LIMIT_MSG
+    
+    elif kind == 'malformed':
+        return _AI_MALFORMED_MSG
+    
+    else:
+        return _AI_GENERIC_MSG
+
+
+# ============================================================================
+# BUFFERED ERROR LOGGING
+# ============================================================================
+
+# Tracked errors waiting for the writer thread; beyond this the oldest are dropped
+_ERROR_LOG_QUEUE_SIZE = 1000
+# Seconds during which further errors of the same type are logged without a traceback
+_TRACEBACK_REPEAT_WINDOW = 1.0
+
+
+class _DropOldestQueueHandler(logging.handlers.QueueHandler):
+    """QueueHandler that evicts the oldest record instead of blocking when full."""
+    
+    def __init__(self, log_queue: queue.Queue, on_drop: Callable[[], None]):
+        super().__init__(log_queue)
+        self.on_drop = on_drop
+    
+    def enqueue(self, record: logging.LogRecord):
+        try:
+            self.queue.put_nowait(record)
+            return
+        except queue.Full:
+            pass
+        
+        try:
+            self.queue.get_nowait()
+        except queue.Empty:
+            pass
+        self.on_drop()
+        try:
+            self.queue.put_nowait(record)
+        except queue.Full:
+            self.on_drop()
+
+
+class _LazyTraceback:
+    """Traceback of the exception being handled, formatted only when rendered."""
+    
+    __slots__ = ('exc_info',)
+    
+    def __init__(self):
+        self.exc_info = sys.exc_info()
+    
+    def __str__(self) -> str:
+        return ''.join(traceback.format_exception(*self.exc_info))
+    
+    def __repr__(self) -> str:
+        # Render inside error_context exactly like the formatted string did
+        return repr(str(self))
+
+
+class _ForwardingHandler(logging.Handler):
+    """Hand records to a logger so its handlers are looked up at write time."""
+    
+    def __init__(self, target: logging.Logger):
+        super().__init__()
+        self.target = target
+    
+    def emit(self, record: logging.LogRecord):
+        self.target.handle(record)
+
+
+# database_service imports this module, so DatabaseService is bound on first use
+_database_service_cls = None
+
+
+def _get_database_service():
+    """Return the DatabaseService class, importing it once on first call."""
+    global _database_service_cls
+    if _database_service_cls is None:
+        from .database_service import DatabaseService
+        _database_service_cls = DatabaseService
+    return _database_service_cls
+
+
 # ============================================================================
 # ERROR HANDLER CLASS
 # ============================================================================
 
+@dataclasses.dataclass(slots=True)
+class WorkaroundStats:
+    """Counters for workaround usage and dropped tracked-error log records."""
+    
+    uc03_attempts: int = 0
+    uc03_successes: int = 0
+    uc17_attempts: int = 0
+    uc17_successes: int = 0
+    dropped_error_logs: int = 0
+    
+    def add(self, other: 'WorkaroundStats'):
+        """Add other's counters into this one."""
+        for field in dataclasses.fields(self):
+            setattr(self, field.name, getattr(self, field.name) + getattr(other, field.name))
+
+
 class ErrorHandler:
     """
     Centralized error handling service that provides workarounds, 
@@ -154,13 +409,37 @@ class ErrorHandler:
     
     def __init__(self):
         """Initialize the error handler."""
-        self.error_counts = {}  # Track error frequencies
-        self.workaround_stats = {
-            'uc03_attempts': 0,
-            'uc03_successes': 0,
-            'uc17_attempts': 0,
-            'uc17_successes': 0
-        }
+        self.error_counts = collections.Counter()  # Track error frequencies
+        # Tracking IDs: start-up second and process ID plus a hex sequence number,
+        # restarted in forked children (gunicorn workers, including --preload)
+        self._reset_tracking_ids()
+        if hasattr(os, 'register_at_fork'):
+            os.register_at_fork(after_in_child=self._reset_tracking_ids)
+        # {error type name: monotonic time its traceback was last attached}
+        self._last_traceback_at = {}
+        # Workaround counters are bumped in per-thread shards and summed on read;
+        # shards of threads that have exited are folded into _workaround_totals
+        self._workaround_totals = WorkaroundStats()
+        self._workaround_local = threading.local()
+        self._workaround_shards = {}  # {thread ident: WorkaroundStats}
+        self._workaround_lock = threading.Lock()
+        # Monotonic time until which UC17 attempts go straight to the manual
+        # path, set when the BusinessDayBehavior=0 retry also hit the missing view
+        self._uc17_skip_retry_until = 0.0
+        # Read-only live view handed out by get_error_statistics
+        self._error_counts_view = types.MappingProxyType(self.error_counts)
+        
+        # log_error only enqueues; a listener thread formats and writes batches
+        # through the module logger's handlers
+        self._log_queue = queue.Queue(maxsize=_ERROR_LOG_QUEUE_SIZE)
+        # Unregistered logger under the module logger's name: records keep their
+        # usual name and caller info but reach only this instance's queue
+        self._tracked_logger = logging.Logger(logger.name)
+        self._tracked_logger.propagate = False
+        self._tracked_logger.addHandler(_DropOldestQueueHandler(self._log_queue, self._count_dropped_log))
+        self._log_listener = None
+        self._log_listener_pid = None
+        self._log_listener_lock = threading.Lock()
     
     # ========================================================================
     # ERROR LOGGING AND TRACKING
@@ -180,35 +459,108 @@ class ErrorHandler:
             String tracking ID for the error
         """
         # Generate tracking ID
-        tracking_id = f"ERR_{int(time.time())}_{id(error) % 10000}"
-        
-        # Build error context
-        error_context = {
-            'tracking_id': tracking_id,
-            'error_type': type(error).__name__,
-            'error_message': str(error),
-            'user_name': user_name,
-            'timestamp': time.time(),
-            'context': context or {},
-            'traceback': traceback.format_exc()
-        }
+        tracking_id = self._id_prefix + format(self._id_seq(), '06x')
+        error_type = type(error).__name__
         
         # Update error count statistics
-        error_type = type(error).__name__
-        self.error_counts[error_type] = self.error_counts.get(error_type, 0) + 1
+        self.error_counts[error_type] += 1
         
         # Log the error
-        logger.error(f"Error tracked [{tracking_id}]: {error_type} - {str(error)}", 
-                    extra={'error_context': error_context})
+        if logger.isEnabledFor(logging.ERROR):
+            error_message = str(error)
+            extra = None
+            if _STRUCTURED_LOGS:
+                # Repeats of an error type inside the window keep their message
+                # but not another copy of the traceback
+                now = time.monotonic()
+                if now - self._last_traceback_at.get(error_type, -_TRACEBACK_REPEAT_WINDOW) < _TRACEBACK_REPEAT_WINDOW:
+                    error_traceback = '<suppressed>'
+                else:
+                    error_traceback = _LazyTraceback()
+                    self._last_traceback_at[error_type] = now
+                
+                # Build error context
+                extra = {'error_context': {
+                    'tracking_id': tracking_id,
+                    'error_type': error_type,
+                    'error_message': error_message,
+                    'user_name': user_name,
+                    'timestamp': time.time(),
+                    'context': context or {},
+                    'traceback': error_traceback
+                }}
+            
+            self._ensure_log_listener()
+            self._tracked_logger.error(f"Error tracked [{tracking_id}]: {error_type} - {error_message}", 
+                                       extra=extra)
         
         return tracking_id
     
+    def _reset_tracking_ids(self):
+        """Start this process's tracking ID sequence; the PID keeps workers apart."""
+        self._id_prefix = f"ERR_{int(time.time())}_{os.getpid()}_"
+        self._id_seq = itertools.count().__next__
+    
+    def _ensure_log_listener(self):
+        """Start the queue listener for this process (again after a fork)."""
+        pid = os.getpid()
+        if self._log_listener_pid == pid:
+            return
+        
+        with self._log_listener_lock:
+            if self._log_listener_pid == pid:
+                return
+            # A listener inherited across fork has no thread; just replace it
+            self._log_listener = logging.handlers.QueueListener(self._log_queue, _ForwardingHandler(logger))
+            self._log_listener.start()
+            self._log_listener_pid = pid
+            atexit.register(self._log_listener.stop)
+    
+    def _count_dropped_log(self):
+        """Record a tracked error log lost to queue overflow."""
+        self._thread_workaround_stats().dropped_error_logs += 1
+    
+    def _thread_workaround_stats(self) -> WorkaroundStats:
+        """Return the calling thread's workaround counter shard."""
+        stats = getattr(self._workaround_local, 'stats', None)
+        if stats is None:
+            stats = self._workaround_local.stats = WorkaroundStats()
+            # current_thread() also registers foreign threads, so the readout's
+            # threading.enumerate() sees every thread that owns a shard
+            ident = threading.current_thread().ident
+            with self._workaround_lock:
+                # Thread idents are reused; keep the finished thread's counts
+                finished = self._workaround_shards.get(ident)
+                if finished is not None:
+                    self._workaround_totals.add(finished)
+                self._workaround_shards[ident] = stats
+        return stats
+    
+    @property
+    def workaround_stats(self) -> WorkaroundStats:
+        """Snapshot of the workaround counters summed across all threads."""
+        with self._workaround_lock:
+            live_idents = {thread.ident for thread in threading.enumerate()}
+            for ident in [ident for ident in self._workaround_shards if ident not in live_idents]:
+                self._workaround_totals.add(self._workaround_shards.pop(ident))
+            
+            totals = dataclasses.replace(self._workaround_totals)
+            for stats in self._workaround_shards.values():
+                totals.add(stats)
+        return totals
+    
     def get_error_statistics(self) -> Dict[str, Any]:
-        """Get error statistics and workaround usage."""
+        """
+        Get error statistics and workaround usage.
+        
+        error_counts is a read-only live view, not a snapshot; wrap it in dict()
+        to keep a point-in-time copy. workaround_stats is a fresh dict summed
+        across threads.
+        """
         return {
-            'error_counts': self.error_counts.copy(),
-            'workaround_stats': self.workaround_stats.copy(),
-            'total_errors': sum(self.error_counts.values())
+            'error_counts': self._error_counts_view,
+            'workaround_stats': dataclasses.asdict(self.workaround_stats),
+            'total_errors': self.error_counts.total()
         }
     
     # ========================================================================
@@ -229,11 +581,17 @@ class ErrorHandler:
         error_str = str(error)
         
         # Handle database-specific errors
-        if isinstance(error, DatabaseError) or 'database' in error_str.lower():
+        if isinstance(error, DatabaseError):
+            return self._format_database_error(error_str, context)
+        
+        # One scan decides both keyword fallbacks ('database' outranks 'groq')
+        match = _SERVICE_KEYWORD_RE.match(error_str)
+        keyword = match.lastgroup if match else None
+        if keyword == 'database':
             return self._format_database_error(error_str, context)
         
         # Handle AI service errors
-        if isinstance(error, AIServiceError) or 'groq' in error_str.lower():
+        if isinstance(error, AIServiceError) or keyword == 'groq':
             return self._format_ai_service_error(error_str, context)
         
         # Handle validation errors
@@ -249,50 +607,17 @@ class ErrorHandler:
     
     def _format_database_error(self, error_str: str, context: Dict[str, Any] = None) -> str:
         """Format database-specific errors."""
-        user_fullname = context.get('user_fullname', 'Unknown User') if context else 'Unknown User'
-        task_name = context.get('task_name', 'the task') if context else 'the task'
-        
-        # Handle specific database error patterns
-        if "'ManagerGroupID'" in error_str and "NULL" in error_str:
-            return (f"I'm sorry, but I couldn't create the task because the user account "
-                   f"'{user_fullname}' isn't fully configured in the system. "
-                   f"Please try one of these options:\n\n"
-                   f"• Use a different user account\n"
-                   f"• Specify who should be assigned the task (e.g., 'assign to John Smith')\n"
-                   f"• Contact your administrator to complete the setup for '{user_fullname}'")
-        
-        elif "Task with the provided name already exists" in error_str:
-            return (f"A task named '{task_name}' already exists. "
-                   f"Please try:\n\n"
-                   f"• Using a different task name\n"
-                   f"• Adding more details to make it unique (e.g., 'follow up email - client ABC')\n"
-                   f"• Including a date or project name")
-        
-        elif "connection" in error_str.lower() or "timeout" in error_str.lower():
-            return ("I'm having trouble connecting to the database right now. "
-                   "Please try again in a moment.")
-        
-        else:
-            return ("There was a problem with the database operation. "
-                   "Please try again or contact support if the issue persists.")
+        if not context:
+            return _format_database_error_text(error_str, 'Unknown User', 'the task')
+        return _format_database_error_text(
+            error_str,
+            context.get('user_fullname', 'Unknown User'),
+            context.get('task_name', 'the task')
+        )
     
     def _format_ai_service_error(self, error_str: str, context: Dict[str, Any] = None) -> str:
         """Format AI service-specific errors."""
-        if "timeout" in error_str.lower():
-            return ("The AI service is taking longer than usual to respond. "
-                   "Please try again with a simpler request.")
-        
-        elif "rate limit" in error_str.lower():
-            return ("I'm receiving too many requests right now. "
-                   "Please wait a moment and try again.")
-        
-        elif "invalid" in error_str.lower() or "malformed" in error_str.lower():
-            return ("I had trouble understanding your request. "
-                   "Could you please rephrase it more clearly?")
-        
-        else:
-            return ("I'm having trouble processing your request right now. "
-                   "Please try again in a moment.")
+        return _format_ai_service_error_text(error_str)
     
     def _format_validation_error(self, error_str: str, context: Dict[str, Any] = None) -> str:
         """Format validation-specific errors."""
@@ -320,18 +645,17 @@ class ErrorHandler:
         Returns:
             True if successful, False otherwise
         """
-        self.workaround_stats['uc03_attempts'] += 1
+        self._thread_workaround_stats().uc03_attempts += 1
         
         try:
-            # Import here to avoid circular imports
-            from .database_service import DatabaseService
+            DatabaseService = _get_database_service()
             
             logger.info(f"UC03 Workaround called for instance {instance_id} with assignees: {assignees_str}")
             
             success = DatabaseService.add_to_priority_list_workaround(instance_id, assignees_str)
             
             if success:
-                self.workaround_stats['uc03_successes'] += 1
+                self._thread_workaround_stats().uc03_successes += 1
                 logger.info(f"UC03 Workaround: Successfully applied for task {instance_id}")
             else:
                 logger.error(f"UC03 Workaround: Failed for task {instance_id}")
@@ -349,67 +673,69 @@ class ErrorHandler:
         
         Args:
             params: Dictionary containing task parameters
-            param_list: List of parameters for stored procedure call
+            param_list: List of parameters for stored procedure call (unused; the
+                retry rebuilds its parameter list from params)
             
         Returns:
             Instance ID if successful, None otherwise
         """
-        self.workaround_stats['uc17_attempts'] += 1
+        self._thread_workaround_stats().uc17_attempts += 1
         
         try:
-            # Import here to avoid circular imports
-            from .database_service import DatabaseService
+            DatabaseService = _get_database_service()
             
             logger.warning("UC17 workaround: Holiday schedule view missing for business day tasks")
             
             # Create modified parameters that avoid the holiday schedule dependency
-            modified_params = params.copy()
-            modified_params['BusinessDayBehavior'] = 0  # Disable business day behavior
-            
-            # Update param_list as well (BusinessDayBehavior is at index 15)
-            modified_param_list = param_list.copy()
-            modified_param_list[15] = 0  # Set BusinessDayBehavior to 0
+            modified_params = {**params, 'BusinessDayBehavior': 0}  # Disable business day behavior
             
             # Try the workaround approach - avoid the stored procedure that references the view
             logger.info("UC17 workaround: Creating task with simplified parameters...")
             
-            # First, try with the main stored procedure call again with BusinessDayBehavior = 0
-            try:
-                instance_id = DatabaseService.create_task_via_stored_procedure(modified_params)
-                
-                if instance_id:
-                    self.workaround_stats['uc17_successes'] += 1
-                    logger.info(f"UC17 workaround success: Created task with modified params, ID: {instance_id}")
+            # First, try with the main stored procedure call again with BusinessDayBehavior = 0,
+            # unless that retry recently hit the missing view in this process
+            if time.monotonic() < self._uc17_skip_retry_until:
+                logger.info("UC17 workaround: Skipping stored procedure retry (view missing even without business days)")
+            else:
+                try:
+                    instance_id = DatabaseService.create_task_via_stored_procedure(modified_params)
                     
-                    # Apply priority list workaround if needed
-                    if modified_params.get('AddToPriorityList') == 1:
-                        self.apply_uc03_priority_list_workaround(
-                            instance_id, 
-                            modified_params.get('Assignees', '')
-                        )
+                    if instance_id:
+                        self._thread_workaround_stats().uc17_successes += 1
+                        logger.info(f"UC17 workaround success: Created task with modified params, ID: {instance_id}")
+                        
+                        # Apply priority list workaround if needed
+                        if modified_params.get('AddToPriorityList') == 1:
+                            self.apply_uc03_priority_list_workaround(
+                                instance_id, 
+                                modified_params.get('Assignees', '')
+                            )
                     
-                    return instance_id
+                    return instance_id or None
                     
-            except Exception as inner_e:
-                # If the stored procedure still fails, try manual task creation approach
-                logger.warning(f"Stored procedure still failed with modified params: {inner_e}")
-                logger.info("UC17 workaround: Attempting manual task creation...")
+                except Exception as inner_e:
+                    # If the stored procedure still fails, try manual task creation approach
+                    logger.warning(f"Stored procedure still failed with modified params: {inner_e}")
+                    if _UC17_MISSING_VIEW in str(inner_e):
+                        self._uc17_skip_retry_until = time.monotonic() + _UC17_RETRY_SKIP_SECONDS
+            
+            logger.info("UC17 workaround: Attempting manual task creation...")
+            
+            # Create task manually without business day validation
+            instance_id = self._create_task_manually(modified_params)
+            
+            if instance_id:
+                self._thread_workaround_stats().uc17_successes += 1
+                logger.info(f"UC17 workaround success (manual): Created task ID: {instance_id}")
                 
-                # Create task manually without business day validation
-                instance_id = self._create_task_manually(modified_params)
+                # Apply priority list workaround if needed
+                if modified_params.get('AddToPriorityList') == 1:
+                    self.apply_uc03_priority_list_workaround(
+                        instance_id, 
+                        modified_params.get('Assignees', '')
+                    )
                 
-                if instance_id:
-                    self.workaround_stats['uc17_successes'] += 1
-                    logger.info(f"UC17 workaround success (manual): Created task ID: {instance_id}")
-                    
-                    # Apply priority list workaround if needed
-                    if modified_params.get('AddToPriorityList') == 1:
-                        self.apply_uc03_priority_list_workaround(
-                            instance_id, 
-                            modified_params.get('Assignees', '')
-                        )
-                    
-                    return instance_id
+                return instance_id
             
             return None
             
@@ -429,30 +755,25 @@ class ErrorHandler:
             Instance ID if successful, None otherwise
         """
         try:
-            from .database_service import DatabaseService
+            DatabaseService = _get_database_service()
             
             logger.info("Manual task creation: Using direct database insertion")
             
             # Use a simplified task creation that doesn't involve business day scheduling
-            with DatabaseService.get_cursor() as cursor:
-                # Create a basic task entry - this is a simplified approach
-                # In a real scenario, you'd need to know the exact table structure
-                task_name = params.get('TaskName', 'Unknown Task')
-                assignees = params.get('Assignees', 'Unknown')
-                due_date = params.get('DueDate', '2025-08-04')  # Default to tomorrow
-                
-                # For UC17 workaround, we'll try to find the task that was partially created
-                # The stored procedure might have created some records before failing
-                logger.info("Searching for partially created task...")
-                instance_id = DatabaseService.find_task_by_name(task_name)
+            task_name = params.get('TaskName', 'Unknown Task')
+            
+            # For UC17 workaround, we'll try to find the task that was partially created
+            # The stored procedure might have created some records before failing
+            logger.info("Searching for partially created task...")
+            instance_id = DatabaseService.find_task_by_name(task_name)
+            
+            if instance_id:
+                logger.info(f"Found partially created task with ID: {instance_id}")
+                return instance_id
+            else:
+                logger.warning("Manual task creation requires database schema knowledge - deferring to error handling")
+                return None
                 
-                if instance_id:
-                    logger.info(f"Found partially created task with ID: {instance_id}")
-                    return instance_id
-                else:
-                    logger.warning("Manual task creation requires database schema knowledge - deferring to error handling")
-                    return None
-                    
         except Exception as e:
             logger.error(f"Manual task creation failed: {e}")
             return None
@@ -473,7 +794,7 @@ class ErrorHandler:
         error_str = str(error)
         
         # UC17 Fix: Handle missing vwHolidaySchedule view
-        if 'vwHolidaySchedule' in error_str:
+        if _UC17_MISSING_VIEW in error_str:
             return self.apply_uc17_holiday_schedule_workaround(params, param_list)
         
         # Log unhandled database errors
@@ -483,15 +804,14 @@ class ErrorHandler:
             'operation': 'task_creation'
         })
         
-        logger.error(f"Unhandled database error [{tracking_id}]: {error_str}")
+        logger.error("Unhandled database error [%s]: %s", tracking_id, error_str)
         return None
     
     # ========================================================================
     # CONTEXT MANAGERS
     # ========================================================================
     
-    @contextmanager
-    def error_context(self, operation: str, user_name: str = None, **context):
+    def error_context(self, operation: str, user_name: str = None, **context) -> '_ErrorContext':
         """
         Context manager for wrapping operations with error handling.
         
@@ -500,44 +820,75 @@ class ErrorHandler:
             user_name: Username for tracking
             **context: Additional context information
         """
+        return _ErrorContext(self, operation, user_name, context)
+
+
+class _ErrorContext:
+    """
+    Context manager returned by ErrorHandler.error_context.
+    
+    Only the raw arguments are stored on entry; the operation context dict is
+    built in __exit__ when an exception actually has to be tracked.
+    """
+    
+    __slots__ = ('handler', 'operation', 'user_name', 'context')
+    
+    def __init__(self, handler: ErrorHandler, operation: str, user_name: Optional[str],
+                 context: Dict[str, Any]):
+        self.handler = handler
+        self.operation = operation
+        self.user_name = user_name
+        self.context = context
+    
+    def __enter__(self):
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(f"Starting operation: {self.operation}")
+    
+    def __exit__(self, exc_type, e, tb):
+        if exc_type is None:
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug(f"Completed operation: {self.operation}")
+            return False
+        if not issubclass(exc_type, Exception):
+            return False
+        
+        handler = self.handler
+        operation = self.operation
         operation_context = {
             'operation': operation,
-            'user_name': user_name,
-            **context
+            'user_name': self.user_name,
+            **self.context
         }
+        tracking_id = handler.log_error(e, operation_context, self.user_name)
         
-        try:
-            logger.debug(f"Starting operation: {operation}")
-            yield
-            logger.debug(f"Completed operation: {operation}")
-            
-        except Exception as e:
-            tracking_id = self.log_error(e, operation_context, user_name)
-            
-            # Re-raise as appropriate service error with tracking
-            if isinstance(e, BaseServiceError):
-                e.details['tracking_id'] = tracking_id
-                raise e
-            else:
-                # Wrap in appropriate service error
-                if isinstance(e, DatabaseError):
-                    raise DatabaseError(
-                        self.format_user_error(e, operation_context),
-                        'DATABASE_OPERATION_FAILED',
-                        {'tracking_id': tracking_id, 'original_error': str(e)}
-                    )
-                elif 'ai' in operation.lower() or 'groq' in operation.lower():
-                    raise AIServiceError(
-                        self.format_user_error(e, operation_context),
-                        'AI_SERVICE_OPERATION_FAILED',
-                        {'tracking_id': tracking_id, 'original_error': str(e)}
-                    )
-                else:
-                    raise BaseServiceError(
-                        self.format_user_error(e, operation_context),
-                        'OPERATION_FAILED',
-                        {'tracking_id': tracking_id, 'original_error': str(e)}
-                    )
+        # Re-raise as appropriate service error with tracking
+        if isinstance(e, BaseServiceError):
+            e.details['tracking_id'] = tracking_id
+            return False
+        
+        # Wrap in appropriate service error
+        error_cls, error_code = _OPERATION_ERROR_WRAPPERS[_operation_kind(operation)]
+        raise error_cls(
+            handler.format_user_error(e, operation_context),
+            error_code,
+            {'tracking_id': tracking_id, 'original_error': str(e)}
+        )
+
+
+# Service error (class, code) that error_context wraps foreign exceptions in,
+# by operation kind. DatabaseError needs no entry: as a BaseServiceError it is
+# re-raised unwrapped.
+_OPERATION_ERROR_WRAPPERS = {
+    'ai': (AIServiceError, 'AI_SERVICE_OPERATION_FAILED'),
+    'generic': (BaseServiceError, 'OPERATION_FAILED'),
+}
+
+
+@functools.lru_cache(maxsize=256)
+def _operation_kind(operation: str) -> str:
+    """Classify an error_context operation name, memoized per name."""
+    operation_lower = operation.lower()
+    return 'ai' if 'ai' in operation_lower or 'groq' in operation_lower else 'generic'
 
 
 # ============================================================================
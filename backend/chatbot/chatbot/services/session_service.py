@@ -6,7 +6,9 @@ handling PendingTaskSession creation, parameter persistence, history tracking,
 and session lifecycle management.
 """
 
+import datetime
 import logging
+import re
 from typing import Dict, Any, List, Optional
 from django.utils import timezone
 
@@ -14,6 +16,17 @@ from ..models import PendingTaskSession
 
 logger = logging.getLogger(__name__)
 
+# Continuation keywords, matched as substrings of the lowercased message
+_CONTINUATION_RE = re.compile(r'more|continue|what else|anything else|also|and')
+
+# Columns a session save writes; the others never change after creation
+_SESSION_UPDATE_FIELDS = ['parameters', 'updated_at']
+
+
+def _empty_session_parameters() -> Dict[str, Any]:
+    """Return a fresh, empty session parameters structure."""
+    return {'params': {}, 'history': []}
+
 
 class SessionService:
     """
@@ -32,7 +45,9 @@ class SessionService:
         Returns:
             PendingTaskSession instance
         """
-        session, created = PendingTaskSession.objects.get_or_create(user=user_name)
+        session, created = PendingTaskSession.objects.get_or_create(
+            user=user_name, defaults={'parameters': _empty_session_parameters()}
+        )
         
         if created:
             logger.info(f"Created new session for user: {user_name}")
@@ -64,9 +79,12 @@ class SessionService:
         # CRITICAL: Clear session parameters for each new task creation request
         # This prevents old task names from being cached and causing duplicate errors
         if user_message and not SessionService._is_continuation_message(user_message):
-            # This is a new task creation request, not a continuation
-            session.parameters = {'params': {}, 'history': []}
-            session.save()
+            # This is a new task creation request, not a continuation.
+            # A new or already-cleared session needs no write.
+            empty_parameters = _empty_session_parameters()
+            if session.parameters != empty_parameters:
+                session.parameters = empty_parameters
+                session.save(update_fields=_SESSION_UPDATE_FIELDS)
             logger.info(f"Cleared session for new task creation request from {user_name}")
         
         return session
@@ -82,8 +100,7 @@ class SessionService:
         Returns:
             True if this appears to be a continuation, False for new task creation
         """
-        continuation_keywords = ['more', 'continue', 'what else', 'anything else', 'also', 'and']
-        return any(keyword in user_message.lower() for keyword in continuation_keywords)
+        return _CONTINUATION_RE.search(user_message.lower()) is not None
     
     @staticmethod
     def get_session_parameters(session: PendingTaskSession) -> Dict[str, Any]:
@@ -112,7 +129,7 @@ class SessionService:
         return session.parameters.get('history', [])
     
     @staticmethod
-    def add_to_session_history(session: PendingTaskSession, role: str, content: str) -> None:
+    def add_to_session_history(session: PendingTaskSession, role: str, content: str) -> List[Dict[str, str]]:
         """
         Add a message to the session conversation history.
         
@@ -120,12 +137,14 @@ class SessionService:
             session: PendingTaskSession instance
             role: Message role ('user' or 'assistant')
             content: Message content
+            
+        Returns:
+            The session's history list, including the new message
         """
-        if 'history' not in session.parameters:
-            session.parameters['history'] = []
-        
-        session.parameters['history'].append({"role": role, "content": content})
+        history = session.parameters.setdefault('history', [])
+        history.append({"role": role, "content": content})
         logger.debug(f"Added {role} message to session history for user: {session.user}")
+        return history
     
     @staticmethod
     def update_session_parameters(session: PendingTaskSession, new_params: Dict[str, Any]) -> None:
@@ -136,10 +155,10 @@ class SessionService:
             session: PendingTaskSession instance
             new_params: New parameters to merge with existing ones
         """
-        if 'params' not in session.parameters:
-            session.parameters['params'] = {}
-        
-        session.parameters['params'].update(new_params)
+        params = session.parameters.setdefault('params', {})
+        # Callers often pass back the dict from get_session_parameters itself
+        if params is not new_params:
+            params.update(new_params)
         logger.debug(f"Updated session parameters for user: {session.user}")
     
     @staticmethod
@@ -150,7 +169,7 @@ class SessionService:
         Args:
             session: PendingTaskSession instance to save
         """
-        session.save()
+        session.save(update_fields=_SESSION_UPDATE_FIELDS)
         logger.debug(f"Saved session for user: {session.user}")
     
     @staticmethod
@@ -161,8 +180,8 @@ class SessionService:
         Args:
             session: PendingTaskSession instance to clear
         """
-        session.parameters = {'params': {}, 'history': []}
-        session.save()
+        session.parameters = _empty_session_parameters()
+        session.save(update_fields=_SESSION_UPDATE_FIELDS)
         logger.info(f"Cleared session data for user: {session.user}")
     
     @staticmethod
@@ -190,10 +209,10 @@ class SessionService:
             # Preserve history if available in error context
             if error_context and 'history' in error_context:
                 session.parameters['history'] = error_context['history']
-            elif 'history' not in session.parameters:
-                session.parameters['history'] = []
+            else:
+                session.parameters.setdefault('history', [])
             
-            session.save()
+            session.save(update_fields=_SESSION_UPDATE_FIELDS)
             logger.debug(f"Handled session error state for user: {session.user}")
         except Exception as e:
             logger.error(f"Failed to handle session error state for user {session.user}: {e}")
@@ -229,13 +248,10 @@ class SessionService:
         Returns:
             Number of sessions deleted
         """
-        from django.utils import timezone
-        import datetime
-        
         cutoff_date = timezone.now() - datetime.timedelta(days=days_old)
-        old_sessions = PendingTaskSession.objects.filter(updated_at__lt=cutoff_date)
-        count = old_sessions.count()
-        old_sessions.delete()
+        # PendingTaskSession has no relations or delete signals, so Django
+        # fast-deletes this as a single DELETE without loading the rows
+        count, _ = PendingTaskSession.objects.filter(updated_at__lt=cutoff_date).delete()
         
         logger.info(f"Cleaned up {count} old sessions (older than {days_old} days)")
         return count
\ No newline at end of file
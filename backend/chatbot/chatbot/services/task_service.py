@@ -10,8 +10,12 @@ import re
 import time
 import logging
 import json as pyjson
+from concurrent.futures import ThreadPoolExecutor
 from typing import Dict, Any, List, Tuple, Optional
 
+from django.db import connection
+
+from ..config.settings import API_SETTINGS
 from .datetime_service import DateTimeService
 from .ai_service import AIService  
 from .database_service import DatabaseService
@@ -28,6 +32,86 @@ from schedule_parser import ScheduleParser
 
 logger = logging.getLogger(__name__)
 
+# Fallback assignee patterns, tried in order when the AI returned no assignees.
+# They stay separate searches: the order is a priority, not text position, and
+# each starts with a literal that re scans for faster than a combined pattern.
+_FALLBACK_ASSIGNEE_PATTERNS = (
+    (re.compile(r'with\s+([A-Z][a-z]+\s+[A-Z][a-z]+)(?:\s+and\s+([A-Z][a-z]+\s+[A-Z][a-z]+))?'), 'with'),
+    (re.compile(r'for\s+([A-Z][a-z]+\s+[A-Z][a-z]+)'), 'for'),
+    (re.compile(r'to\s+([A-Z][a-z]+\s+[A-Z][a-z]+)'), 'to'),
+)
+
+def _parse_due_date(date_str: str) -> datetime.date:
+    """Parse a YYYY-MM-DD date, taking the fast ISO path for zero-padded input."""
+    if len(date_str) == 10 and date_str[4] == '-' and date_str[7] == '-':
+        return datetime.date.fromisoformat(date_str)
+    # strptime also accepts unpadded months and days, e.g. 2025-5-7
+    return datetime.datetime.strptime(date_str, '%Y-%m-%d').date()
+
+
+# Text frequency types accepted from the model, mapped to FreqType values
+_FREQ_TYPES = {
+    'daily': 1, 'day': 1, '1': 1,
+    'weekly': 2, 'week': 2, '2': 2,
+    'monthly': 3, 'month': 3, '3': 3,
+    'yearly': 4, 'year': 4, '4': 4,
+}
+
+# Zero-padded HH:MM times mapped to the stored procedure's HHMM integer form
+_DUE_TIME_INTS = {f'{hour:02d}:{minute:02d}': hour * 100 + minute for hour in range(24) for minute in range(60)}
+
+# Boolean-like strings accepted for integer flags
+_BOOLEAN_STRINGS = {
+    'yes': 1, 'true': 1, '1': 1, 'on': 1,
+    'no': 0, 'false': 0, '0': 0, 'off': 0,
+}
+
+# Stored procedure parameter names, in call order
+_STORED_PROC_PARAM_NAMES = (
+    'TaskName', 'MainController', 'Controllers', 'Assignees', 'DueDate',
+    'LocalDueDate', 'Location', 'DueTime', 'SoftDueDate', 'FinalDueDate',
+    'Items', 'IsRecurring', 'FreqType', 'FreqRecurrance', 'FreqInterval',
+    'BusinessDayBehavior', 'Activate', 'IsReminder', 'ReminderDate', 'AddToPriorityList',
+)
+
+# Integer task parameters, with the value used when one cannot be converted
+_INTEGER_PARAM_DEFAULTS = {
+    'IsRecurring': 0,
+    'FreqRecurrance': 1,
+    'FreqInterval': 1,
+    'BusinessDayBehavior': 0,
+    'Activate': 1,
+    'IsReminder': 1,
+    'AddToPriorityList': 0
+}
+
+
+def _convert_freq_type_to_int(freq_type):
+    """Convert a text-based frequency type to its integer FreqType, defaulting to Daily."""
+    if isinstance(freq_type, int):
+        return freq_type
+    if isinstance(freq_type, str):
+        return _FREQ_TYPES.get(freq_type.lower().strip(), 1)
+    return 1  # Default to Daily
+
+
+def _convert_to_int(value, param_name):
+    """Convert value to integer with proper handling for boolean-like strings"""
+    if isinstance(value, int):
+        return value
+    if isinstance(value, str):
+        # Handle boolean-like strings
+        flag = _BOOLEAN_STRINGS.get(value.lower().strip())
+        if flag is not None:
+            return flag
+        # Try direct conversion
+        try:
+            return int(value)
+        except ValueError:
+            pass
+    # Set default values if conversion fails
+    return _INTEGER_PARAM_DEFAULTS.get(param_name, 0)
+
 
 # TaskCreationError is now imported from error_handler
 
@@ -82,18 +166,12 @@ class TaskService:
         session = SessionService.manage_task_session(user_name, user_message)
         
         try:
-            # Get parameters and history from session
+            # Get parameters from session
             params = SessionService.get_session_parameters(session)
-            history = SessionService.get_session_history(session)
-            
-            # Add current user message to history BEFORE calling AI service
-            SessionService.add_to_session_history(session, "user", user_message)
-            # Get updated history that includes the current message
-            history = SessionService.get_session_history(session)
             
-            # Ensure history has at least one message for Groq API
-            if not history:
-                history = [{"role": "user", "content": user_message}]
+            # Add current user message to history BEFORE calling AI service;
+            # the returned history includes it, so it is never empty
+            history = SessionService.add_to_session_history(session, "user", user_message)
             
             # Get current date in user's timezone for context
             current_date = DateTimeService.get_current_date_in_timezone(user_timezone)
@@ -214,27 +292,19 @@ class TaskService:
     
     def _apply_fallback_extraction(self, params: Dict[str, Any], user_message: str, main_controller: str) -> Dict[str, Any]:
         """Apply fallback extraction if AI didn't extract assignees."""
+        msg_lower = user_message.lower()
         if ('Assignees' not in params or params['Assignees'] in [None, '']) and user_message:
-            msg_lower = user_message.lower()
-            
             # Check for "remind me" pattern
             if 'remind me' in msg_lower:
                 params['Assignees'] = main_controller
                 logger.debug(f"Fallback extraction: 'remind me' → Assignees='{main_controller}'")
             else:
                 # Try various patterns
-                patterns = [
-                    (r'with\s+([A-Z][a-z]+\s+[A-Z][a-z]+)(?:\s+and\s+([A-Z][a-z]+\s+[A-Z][a-z]+))?', 'with'),
-                    (r'for\s+([A-Z][a-z]+\s+[A-Z][a-z]+)', 'for'),
-                    (r'to\s+([A-Z][a-z]+\s+[A-Z][a-z]+)', 'to')
-                ]
-                
-                for pattern, pattern_name in patterns:
-                    match = re.search(pattern, user_message)
+                for pattern, pattern_name in _FALLBACK_ASSIGNEE_PATTERNS:
+                    match = pattern.search(user_message)
                     if match:
-                        assignees = [match.group(1)]
-                        if match.group(2):  # Second group for 'with' pattern
-                            assignees.append(match.group(2))
+                        # Only the 'with' pattern has a second (optional) name
+                        assignees = [name for name in match.groups() if name]
                         params['Assignees'] = ','.join(assignees)
                         logger.debug(f"Fallback extraction: '{pattern_name}' pattern → Assignees='{params['Assignees']}'")
                         break
@@ -242,7 +312,7 @@ class TaskService:
         # Extract priority list if missing
         current_priority = params.get('AddToPriorityList')
         if current_priority is None or str(current_priority) in ['', '0', 'None', '0.0']:
-            if 'priority list' in user_message.lower() or 'add to priority' in user_message.lower():
+            if 'priority list' in msg_lower or 'add to priority' in msg_lower:
                 params['AddToPriorityList'] = 1
                 logger.debug("Fallback extraction: Found 'priority list' → AddToPriorityList=1")
             else:
@@ -278,9 +348,11 @@ class TaskService:
         if pre_extracted.get('_reminder_offset_hours'):
             try:
                 offset_hours = pre_extracted['_reminder_offset_hours']
-                due_date = datetime.datetime.strptime(params['DueDate'], '%Y-%m-%d')
+                due_date = _parse_due_date(params['DueDate'])
                 due_time_parts = params.get('DueTime', '19:00').split(':')
-                due_datetime = due_date.replace(hour=int(due_time_parts[0]), minute=int(due_time_parts[1]))
+                due_datetime = datetime.datetime.combine(
+                    due_date, datetime.time(hour=int(due_time_parts[0]), minute=int(due_time_parts[1]))
+                )
                 reminder_datetime = due_datetime - datetime.timedelta(hours=offset_hours)
                 params['ReminderDate'] = reminder_datetime.date().isoformat()
                 logger.debug(f"Calculated reminder date {offset_hours} hours before: {params['ReminderDate']}")
@@ -341,7 +413,7 @@ class TaskService:
         if 'ReminderDate' not in params or params['ReminderDate'] in [None, '']:
             if params.get('DueDate'):
                 try:
-                    due_date = datetime.datetime.strptime(params['DueDate'], '%Y-%m-%d').date()
+                    due_date = _parse_due_date(params['DueDate'])
                     reminder_date = due_date - datetime.timedelta(days=1)
                     params['ReminderDate'] = reminder_date.isoformat()
                 except:
@@ -366,64 +438,20 @@ class TaskService:
     def _convert_parameter_types(self, params: Dict[str, Any]) -> Dict[str, Any]:
         """Convert and validate parameter types."""
         
-        # Convert text-based frequency types to integers
-        def convert_freq_type_to_int(freq_type):
-            if isinstance(freq_type, int):
-                return freq_type
-            if isinstance(freq_type, str):
-                freq_lower = freq_type.lower().strip()
-                if freq_lower in ['daily', 'day', '1']:
-                    return 1
-                elif freq_lower in ['weekly', 'week', '2']:
-                    return 2
-                elif freq_lower in ['monthly', 'month', '3']:
-                    return 3
-                elif freq_lower in ['yearly', 'year', '4']:
-                    return 4
-            return 1  # Default to Daily
-        
         # Convert FreqType to integer if it's a string
         if 'FreqType' in params:
-            params['FreqType'] = convert_freq_type_to_int(params['FreqType'])
+            params['FreqType'] = _convert_freq_type_to_int(params['FreqType'])
         
         # Ensure all integer parameters are actually integers
-        def convert_to_int(value, param_name):
-            """Convert value to integer with proper handling for boolean-like strings"""
-            if isinstance(value, int):
-                return value
-            if isinstance(value, str):
-                value_lower = value.lower().strip()
-                # Handle boolean-like strings
-                if value_lower in ['yes', 'true', '1', 'on']:
-                    return 1
-                elif value_lower in ['no', 'false', '0', 'off']:
-                    return 0
-                # Try direct conversion
-                try:
-                    return int(value)
-                except ValueError:
-                    pass
-            # Set default values if conversion fails
-            default_values = {
-                'IsRecurring': 0,
-                'FreqRecurrance': 1,
-                'FreqInterval': 1,
-                'BusinessDayBehavior': 0,
-                'Activate': 1,
-                'IsReminder': 1,
-                'AddToPriorityList': 0
-            }
-            return default_values.get(param_name, 0)
-        
-        integer_params = ['IsRecurring', 'FreqRecurrance', 'FreqInterval', 'BusinessDayBehavior', 'Activate', 'IsReminder', 'AddToPriorityList']
-        for param in integer_params:
+        for param in _INTEGER_PARAM_DEFAULTS:
             if param in params:
-                params[param] = convert_to_int(params[param], param)
+                params[param] = _convert_to_int(params[param], param)
         
         return params
     
-    def _create_single_task(self, params: Dict[str, Any], user_fullname: str, debug_mode: bool = False) -> Optional[int]:
-        """Create a single task using the database service."""
+    def _build_stored_proc_params(self, params: Dict[str, Any], user_fullname: str,
+                                  debug_mode: bool = False) -> List[Any]:
+        """Build the stored procedure parameter list for a task, logging suspicious values."""
         
         # Convert time format from HH:MM to integer format
         due_time_int = self._convert_time_to_int(params.get('DueTime', '19:00'))
@@ -497,41 +525,21 @@ class TaskService:
             logger.info(f"STORED PROCEDURE CALL for task: {params['TaskName']}")
             logger.info("="*60)
             
-            param_names = [
-                'TaskName', 'MainController', 'Controllers', 'Assignees', 'DueDate',
-                'LocalDueDate', 'Location', 'DueTime', 'SoftDueDate', 'FinalDueDate',
-                'Items', 'IsRecurring', 'FreqType', 'FreqRecurrance', 'FreqInterval',
-                'BusinessDayBehavior', 'Activate', 'IsReminder', 'ReminderDate', 'AddToPriorityList'
-            ]
-            
             logger.info("Parameters being sent to stored procedure:")
-            for i, (name, value) in enumerate(zip(param_names, stored_proc_params)):
+            for i, (name, value) in enumerate(zip(_STORED_PROC_PARAM_NAMES, stored_proc_params)):
                 logger.info(f"  {name}: '{value}' (type: {type(value).__name__})")
         
+        return stored_proc_params
+    
+    def _create_single_task(self, params: Dict[str, Any], user_fullname: str, debug_mode: bool = False,
+                            stored_proc_params: Optional[List[Any]] = None) -> Optional[int]:
+        """Create a single task using the database service."""
+        if stored_proc_params is None:
+            stored_proc_params = self._build_stored_proc_params(params, user_fullname, debug_mode)
+        
         try:
             # Create task using DatabaseService
-            main_task_params = {
-                'TaskName': stored_proc_params[0],
-                'MainController': stored_proc_params[1],
-                'Controllers': stored_proc_params[2],
-                'Assignees': stored_proc_params[3],
-                'DueDate': stored_proc_params[4],
-                'LocalDueDate': stored_proc_params[5],
-                'Location': stored_proc_params[6],
-                'DueTime': stored_proc_params[7],
-                'SoftDueDate': stored_proc_params[8],
-                'FinalDueDate': stored_proc_params[9],
-                'Items': stored_proc_params[10],
-                'IsRecurring': stored_proc_params[11],
-                'FreqType': stored_proc_params[12],
-                'FreqRecurrance': stored_proc_params[13],
-                'FreqInterval': stored_proc_params[14],
-                'BusinessDayBehavior': stored_proc_params[15],
-                'Activate': stored_proc_params[16],
-                'IsReminder': stored_proc_params[17],
-                'ReminderDate': stored_proc_params[18],
-                'AddToPriorityList': stored_proc_params[19],
-            }
+            main_task_params = dict(zip(_STORED_PROC_PARAM_NAMES, stored_proc_params))
             
             logger.info("Executing stored procedure...")
             new_instance_id = DatabaseService.create_task_with_priority_handling(
@@ -546,27 +554,34 @@ class TaskService:
                 raise TaskCreationError('Task creation failed - no instance ID returned')
                 
         except Exception as e:
-            error_str = str(e)
-            
-            # Use ErrorHandler to format user-friendly error messages
-            context = {
-                'user_fullname': user_fullname,
-                'task_name': params.get('TaskName', 'Unknown'),
-                'operation': 'task_creation'
-            }
-            
-            # Log the error with context
-            tracking_id = error_handler.log_error(e, context, user_fullname)
-            
-            # Format user-friendly error message
-            user_message = error_handler.format_user_error(e, context)
-            
-            logger.error(f"Stored procedure error [{tracking_id}]: {str(e)}. Parameters: {stored_proc_params}")
-            raise TaskCreationError(user_message, 'TASK_CREATION_FAILED', {'tracking_id': tracking_id})
+            raise self._task_creation_error(e, params, user_fullname, stored_proc_params)
+    
+    def _task_creation_error(self, error: Exception, params: Dict[str, Any], user_fullname: str,
+                             stored_proc_params: List[Any]) -> TaskCreationError:
+        """Log a failed task creation and wrap it in a user-friendly TaskCreationError."""
+        # Use ErrorHandler to format user-friendly error messages
+        context = {
+            'user_fullname': user_fullname,
+            'task_name': params.get('TaskName', 'Unknown'),
+            'operation': 'task_creation'
+        }
+        
+        # Log the error with context
+        tracking_id = error_handler.log_error(error, context, user_fullname)
+        
+        # Format user-friendly error message
+        user_message = error_handler.format_user_error(error, context)
+        
+        logger.error(f"Stored procedure error [{tracking_id}]: {str(error)}. Parameters: {stored_proc_params}")
+        return TaskCreationError(user_message, 'TASK_CREATION_FAILED', {'tracking_id': tracking_id})
     
     def _convert_time_to_int(self, time_str: str) -> int:
         """Convert time string to integer format for SQL Server."""
         try:
+            due_time = _DUE_TIME_INTS.get(time_str)
+            if due_time is not None:
+                return due_time
+            # Unpadded or out-of-range times, e.g. 9:30
             time_parts = time_str.split(':')
             if len(time_parts) == 2:
                 hours = int(time_parts[0])
@@ -577,12 +592,42 @@ class TaskService:
         except:
             return 19000  # Default to 7 PM
     
+    def _create_batch_tasks(self, tasks: List[Tuple[Dict[str, Any], List[Any]]], user_fullname: str,
+                            debug_mode: bool) -> List[Tuple[Optional[int], Optional[Exception]]]:
+        """Create prepared batch tasks in order, returning (instance ID, error) for each."""
+        outcomes = []
+        for params, stored_proc_params in tasks:
+            try:
+                outcomes.append((self._create_single_task(params, user_fullname, debug_mode, stored_proc_params), None))
+            except Exception as e:
+                outcomes.append((None, e))
+        return outcomes
+    
+    def _create_batch_tasks_in_worker(self, tasks: List[Tuple[Dict[str, Any], List[Any]]], user_fullname: str,
+                                      debug_mode: bool) -> List[Tuple[Optional[int], Optional[Exception]]]:
+        """Create a slice of batch tasks on a pool thread, then close that thread's DB connection."""
+        try:
+            return self._create_batch_tasks(tasks, user_fullname, debug_mode)
+        finally:
+            # Pool threads are outside the request cycle, so Django won't close it
+            connection.close()
+    
     def _handle_batch_task_creation(self, batch_tasks: List[str], base_params: Dict[str, Any], 
                                   user_fullname: str, user_timezone: str, debug_mode: bool = False) -> Dict[str, Any]:
         """Handle creation of multiple tasks in a batch."""
         logger.info(f"Starting batch task creation for {len(batch_tasks)} tasks")
         created_tasks = []
         failed_tasks = []
+        # (params, stored procedure parameters) for every task that passed validation
+        prepared_tasks = []
+        
+        # Every task shares the base assignees, so validate them once
+        assignees_error = None
+        if 'Assignees' in base_params:
+            try:
+                ValidationService.validate_assignees(base_params['Assignees'])
+            except Exception as e:
+                assignees_error = e
         
         for task_name in batch_tasks:
             batch_params = base_params.copy()
@@ -595,27 +640,93 @@ class TaskService:
             try:
                 # Validate batch task parameters
                 ValidationService.validate_task_name(batch_params['TaskName'])
-                if 'Assignees' in batch_params:
-                    ValidationService.validate_assignees(batch_params['Assignees'])
+                if assignees_error:
+                    raise assignees_error
                 
                 # Apply defaults and automatic parameters for each task
                 batch_params = DateTimeService.set_default_due_date_time(batch_params, user_timezone)
                 batch_params = self._set_automatic_parameters(batch_params, user_timezone)
                 batch_params = self._convert_parameter_types(batch_params)
                 
-                # Create the task
-                instance_id = self._create_single_task(batch_params, user_fullname, debug_mode)
-                
-                if instance_id:
-                    created_tasks.append((batch_params['TaskName'], instance_id))
-                    logger.debug(f"Successfully created batch task: {batch_params['TaskName']} with ID: {instance_id}")
-                else:
-                    failed_tasks.append((batch_params['TaskName'], "Task creation failed"))
+                prepared_tasks.append(
+                    (batch_params, self._build_stored_proc_params(batch_params, user_fullname, debug_mode))
+                )
                     
             except Exception as e:
                 logger.error(f"Failed to create batch task '{batch_params['TaskName']}': {e}")
                 failed_tasks.append((batch_params['TaskName'], str(e)))
         
+        # Submit the tasks in one round-trip where possible; UC08 tasks, and any
+        # tasks the server rejected in the bulk batch, are created one at a time
+        bulk_tasks = []
+        single_tasks = []
+        for task in prepared_tasks:
+            (bulk_tasks if DatabaseService.supports_bulk_creation(task[1]) else single_tasks).append(task)
+        bulk_ids, bulk_error, retry_safe = [], None, True
+        if bulk_tasks:
+            bulk_ids, bulk_error, retry_safe = DatabaseService.create_tasks_bulk([task[1] for task in bulk_tasks])
+        
+        for (batch_params, _), instance_id in zip(bulk_tasks, bulk_ids):
+            if instance_id:
+                created_tasks.append((batch_params['TaskName'], instance_id))
+                logger.debug(f"Successfully created batch task: {batch_params['TaskName']} with ID: {instance_id}")
+            else:
+                failed_tasks.append((batch_params['TaskName'], "Task creation failed"))
+        
+        remaining_tasks = bulk_tasks[len(bulk_ids):]
+        if bulk_error is not None:
+            # The task the server rejected may be half created, so it is not
+            # retried; it gets the same workarounds and error message as the
+            # single-task path, and only the tasks after it are retried
+            (batch_params, stored_proc_params), remaining_tasks = remaining_tasks[0], remaining_tasks[1:]
+            instance_id = error_handler.handle_database_error_with_workarounds(
+                bulk_error, dict(zip(_STORED_PROC_PARAM_NAMES, stored_proc_params)), stored_proc_params
+            )
+            if instance_id:
+                created_tasks.append((batch_params['TaskName'], instance_id))
+                logger.debug(f"Created batch task through a workaround: {batch_params['TaskName']} with ID: {instance_id}")
+            else:
+                error = self._task_creation_error(bulk_error, batch_params, user_fullname, stored_proc_params)
+                logger.error(f"Failed to create batch task '{batch_params['TaskName']}': {error}")
+                failed_tasks.append((batch_params['TaskName'], str(error)))
+        
+        if retry_safe:
+            single_tasks = remaining_tasks + single_tasks
+        else:
+            # They may have been created even though no result came back, so
+            # retrying could create duplicates
+            for batch_params, _ in remaining_tasks:
+                failed_tasks.append((batch_params['TaskName'],
+                                     "Lost contact with the database; please check whether this task was created"))
+        
+        # The remaining tasks are independent round-trips, so overlap them: each
+        # pool thread takes a slice (one connection per thread) and the request
+        # thread takes the first slice on its own connection
+        workers = min(API_SETTINGS['BATCH_CREATE_WORKERS'], len(single_tasks))
+        if workers > 1:
+            slices = [single_tasks[i::workers] for i in range(workers)]
+            with ThreadPoolExecutor(max_workers=workers - 1) as executor:
+                futures = [
+                    executor.submit(self._create_batch_tasks_in_worker, task_slice, user_fullname, debug_mode)
+                    for task_slice in slices[1:]
+                ]
+                slice_outcomes = [self._create_batch_tasks(slices[0], user_fullname, debug_mode)]
+                slice_outcomes += [future.result() for future in futures]
+            # Back to task order: task i was item i // workers of slice i % workers
+            outcomes = [slice_outcomes[i % workers][i // workers] for i in range(len(single_tasks))]
+        else:
+            outcomes = self._create_batch_tasks(single_tasks, user_fullname, debug_mode)
+        
+        for (batch_params, _), (instance_id, error) in zip(single_tasks, outcomes):
+            if error is not None:
+                logger.error(f"Failed to create batch task '{batch_params['TaskName']}': {error}")
+                failed_tasks.append((batch_params['TaskName'], str(error)))
+            elif instance_id:
+                created_tasks.append((batch_params['TaskName'], instance_id))
+                logger.debug(f"Successfully created batch task: {batch_params['TaskName']} with ID: {instance_id}")
+            else:
+                failed_tasks.append((batch_params['TaskName'], "Task creation failed"))
+        
         # Build response
         if created_tasks:
             task_list_items = []
@@ -662,7 +773,7 @@ class TaskService:
         due_date_str = ""
         if params.get('DueDate'):
             try:
-                due_date = datetime.datetime.strptime(params['DueDate'], '%Y-%m-%d')
+                due_date = _parse_due_date(params['DueDate'])
                 due_date_str = due_date.strftime('%A, %b %d')
             except:
                 due_date_str = params['DueDate']
@@ -90,6 +90,9 @@ DATABASES = {
         'PASSWORD': '',  # Leave blank for Trusted_Connection
         'HOST': 'DESKTOP-BIP1CP7\\SQLEXPRESS',
         'PORT': '',
+        # Keep connections open between requests; pyodbc has no pool of its own
+        'CONN_MAX_AGE': 300,
+        'CONN_HEALTH_CHECKS': True,
         'OPTIONS': {
             'driver': 'ODBC Driver 17 for SQL Server',
             'trusted_connection': 'yes',
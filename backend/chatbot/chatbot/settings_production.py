@@ -19,6 +19,9 @@ DATABASES = {
         'PASSWORD': os.getenv('DB_PASSWORD', ''),
         'HOST': os.getenv('DB_HOST', 'DESKTOP-BIP1CP7\\SQLEXPRESS'),
         'PORT': os.getenv('DB_PORT', ''),
+        # Persistent connections (seconds); 0 restores per-request connections
+        'CONN_MAX_AGE': int(os.getenv('DB_CONN_MAX_AGE', '300')),
+        'CONN_HEALTH_CHECKS': True,
         'OPTIONS': {
             'driver': 'ODBC Driver 17 for SQL Server',
             'trusted_connection': 'yes' if not os.getenv('DB_USER') else 'no',
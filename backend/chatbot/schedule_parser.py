@@ -255,7 +255,7 @@ class ScheduleParser:
             result['FreqRecurrance'] = month_bitmask
             
         # Extract specific date if present  
-        date_match = re.search(r'(\w+)\s+(\d{1,2})', msg)
+        date_match = re.search(r'\b(\w+)\s+(\d{1,2})', msg)
         if date_match:
             month_str = date_match.group(1).lower()
             day = int(date_match.group(2))